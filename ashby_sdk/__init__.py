@@ -34,15 +34,21 @@ Resources:
     - client.interview_schedules - Interview schedules
     - client.hiring_team_roles - Hiring team roles
 
+Async Usage (pip install "ashby[async]"):
+    >>> async with AshbyAsyncClient() as client:
+    ...     jobs = await client.jobs.list(status=["Open"])
+
 Convenience Methods:
     - client.get_job_funnel(job_id) - Get all stages for a job
     - client.get_application_stage(app_id) - Get current stage
     - client.move_application_to_stage(app_id, stage_id) - Move candidate in funnel
+    - client.get_applications_with_candidates(app_ids) - Fetch many applications concurrently
 
 For full documentation, see: https://github.com/deepweather/ashby_python_sdk
 """
 
 from .client import AshbyClient
+from .client_async import AshbyAsyncClient
 from .models import (
     Application,
     ApplicationFormSubmission,
@@ -85,6 +91,7 @@ __version__ = "0.4.1"
 __all__ = [
     # Main client
     "AshbyClient",
+    "AshbyAsyncClient",
     # Core models
     "Job",
     "JobPosting",
@@ -0,0 +1,38 @@
+"""
+JSON codec shared by the sync and async clients.
+
+Picked once at import time: orjson (pip install ashby[fast]), then ujson,
+then the stdlib. All decoders accept the raw response bytes; the encoder
+always returns bytes ready to send as the request body.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+__all__ = ["dumps", "loads"]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Encode a request body with the stdlib json module."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+dumps: Callable[[Any], bytes]
+loads: Callable[[bytes], Any]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    dumps = _stdlib_dumps
+    try:
+        import ujson  # type: ignore[import-untyped]
+    except ImportError:
+        loads = json.loads
+    else:
+        loads = ujson.loads
+else:
+    dumps = orjson.dumps
+    loads = orjson.loads
@@ -8,12 +8,22 @@ from __future__ import annotations
 
 import os
 import base64
-from typing import Generator, Optional
+import contextlib
+import functools
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Callable, Generator
+from typing import Any, Optional, TypeVar
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import Retry
 
-from .exceptions import AshbyAPIError, AshbyAuthError
+from ._json import dumps as _dumps, loads as _loads
+from .exceptions import AshbyAPIError, AshbyAuthError, AshbyRateLimitError
 from .models import (
     Application,
     ArchiveReason,
@@ -33,6 +43,7 @@ from .models import (
     Source,
     Tag,
     User,
+    _keeping_raw,
 )
 from .resources import (
     JobsResource,
@@ -46,10 +57,74 @@ from .resources import (
     GenericResource,
     FeedbackResource,
 )
+from .resources.base import _POOL_MAXSIZE, _in_caller_context
+
 
 # Load .env file if present
 load_dotenv()
 
+# Encoded request body for endpoints called without parameters
+_EMPTY_BODY = b"{}"
+
+# Most entries kept in the response cache; the oldest is evicted beyond this
+_CACHE_MAXSIZE = 1024
+
+# Retry policy shared by the sync and async clients
+_MAX_RETRIES = 8
+_BACKOFF_FACTOR = 0.5
+_BACKOFF_MAX = 30
+_BACKOFF_JITTER = 1.0
+
+# Statuses retried for reads, and the subset that is safe to retry for writes
+# (the server rejected the request before acting on it)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_WRITE_RETRY_STATUSES = (429, 503)
+
+# Endpoints that modify data in Ashby
+WRITE_ENDPOINTS: frozenset[str] = frozenset({
+    "candidate.createNote",
+    "candidate.addTag",
+    "application.changeStage",
+    "application.update",
+})
+
+
+def _retry(statuses: tuple[int, ...], idempotent: bool = True) -> Retry:
+    """
+    Build the urllib3 retry policy for the given retryable statuses.
+
+    Non-idempotent requests are never retried after a read error, since the
+    server may already have acted on them.
+    """
+    return Retry(
+        total=_MAX_RETRIES,
+        read=None if idempotent else 0,
+        other=None if idempotent else 0,
+        backoff_factor=_BACKOFF_FACTOR,
+        backoff_max=_BACKOFF_MAX,
+        backoff_jitter=_BACKOFF_JITTER,
+        status_forcelist=statuses,
+        allowed_methods=["POST"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number attempt (1-based), as _retry() would.
+
+    A Retry-After header (seconds or an HTTP date) is honored when present;
+    otherwise the delay backs off exponentially with jitter.
+    """
+    if retry_after:
+        with contextlib.suppress(InvalidHeader):
+            return Retry().parse_retry_after(retry_after)
+    if attempt <= 1:
+        return 0.0
+    backoff = _BACKOFF_FACTOR * 2.0 ** (attempt - 1) + random.uniform(0, _BACKOFF_JITTER)
+    return min(backoff, _BACKOFF_MAX)
+
 
 # ---------------------------------------------------------------------------
 # Generic Resource Registry
@@ -65,6 +140,9 @@ load_dotenv()
 #   -> Deserializes to Source model
 #   -> supports_get=False means .get() raises NotImplementedError
 #
+# Resources are built on first attribute access (see AshbyClient.__getattr__),
+# so constructing a client costs nothing per registry entry.
+#
 SIMPLE_RESOURCES: dict[str, tuple[type, str, bool]] = {
     # Hiring Process Metadata (read-only list endpoints)
     "sources": (Source, "source", False),
@@ -92,6 +170,68 @@ SIMPLE_RESOURCES: dict[str, tuple[type, str, bool]] = {
     "interview_schedules": (InterviewSchedule, "interviewSchedule", True),
 }
 
+# Registry entries whose responses are organization metadata that rarely
+# changes. Their list/get results are cached on the client for cache_ttl
+# seconds. Mutable records (offers, interviews, projects) are never cached.
+CACHED_RESOURCES: frozenset[str] = frozenset({
+    "sources",
+    "archive_reasons",
+    "close_reasons",
+    "candidate_tags",
+    "hiring_team_roles",
+    "departments",
+    "locations",
+    "users",
+    "custom_fields",
+})
+
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=32)
+def _auth_header(api_key: str) -> str:
+    """Build the Basic auth header value (API key as username, empty password)."""
+    return "Basic " + base64.b64encode(f"{api_key}:".encode()).decode()
+
+
+def _check_status(response: Any) -> None:
+    """Raise SDK errors for auth failures and exhausted rate-limit retries."""
+    status_code = response.status_code
+    if status_code == 401:
+        raise AshbyAuthError("Invalid or missing API key")
+    if status_code == 403:
+        raise AshbyAuthError("API key does not have permission for this endpoint")
+    if status_code == 429:
+        retry_after = response.headers.get("Retry-After")
+        message = "Rate limit exceeded"
+        if retry_after:
+            message += f" (retry after {retry_after}s)"
+        raise AshbyRateLimitError(message, retry_after=retry_after)
+
+
+def _check_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Return a decoded response body, raising AshbyAPIError if it reports failure."""
+    if not result.get("success", False):
+        errors = result.get("errors", [])
+        error_info = result.get("errorInfo", {})
+        message = error_info.get("message") if error_info else None
+        if not message and errors:
+            message = str(errors)
+        if not message:
+            message = f"Unknown error (response: {result})"
+        raise AshbyAPIError(f"API error: {message}", errors=errors)
+    return result
+
+
+def _unpack_page(response: dict[str, Any]) -> tuple[list[Any], Optional[str]]:
+    """
+    Split a list-endpoint response into its results and continuation cursor.
+
+    The cursor is None when the server reports no more data or omits it.
+    """
+    next_cursor = response.get("nextCursor") if response.get("moreDataAvailable") else None
+    return response.get("results") or [], next_cursor or None
+
 
 class AshbyClient:
     """
@@ -104,16 +244,25 @@ class AshbyClient:
         jobs = client.jobs.list(status=["Open"])
         applications = client.applications.list(job_id="...")
         candidate = client.candidates.get(candidate_id="...")
+
+        # Or as a context manager to release pooled connections on exit
+        with AshbyClient() as client:
+            jobs = client.jobs.list()
     """
 
     BASE_URL = "https://api.ashbyhq.com"
 
-    def __init__(self, api_key: Optional[str] = None):
+    # JSON decoder for response bodies; override to plug in a different parser
+    _json_loads = staticmethod(_loads)
+
+    def __init__(self, api_key: Optional[str] = None, cache_ttl: float = 300):
         """
         Initialize the Ashby client.
 
         Args:
             api_key: Ashby API key. If not provided, reads from ASHBY_API_KEY env var.
+            cache_ttl: Seconds to cache metadata lookups such as departments,
+                users and sources (default 300). Use 0 to disable caching.
 
         Raises:
             AshbyAuthError: If no API key is provided or found in environment.
@@ -124,14 +273,52 @@ class AshbyClient:
                 "API key is required. Provide it as argument or set ASHBY_API_KEY env var."
             )
 
-        # Basic auth: API key as username, empty password
-        credentials = f"{self.api_key}:"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-        self._headers = {
-            "Authorization": f"Basic {encoded_credentials}",
+        # Persistent session: keep-alive and connection pooling across requests.
+        # Headers are set once here so requests doesn't rebuild them per call.
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": _auth_header(self.api_key),
             "Content-Type": "application/json",
             "Accept": "application/json",
-        }
+        })
+        self._base_url = self.BASE_URL.rstrip("/") + "/"
+        # Full URL per endpoint; the client only ever talks to a handful.
+        self._urls: dict[str, str] = {}
+
+        # Retry rate limits and transient gateway errors, honoring Retry-After
+        # and otherwise backing off exponentially with jitter.
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_POOL_MAXSIZE,
+                max_retries=_retry(_RETRY_STATUSES),
+            ),
+        )
+        # Writes are not idempotent: only retry when the server cannot have
+        # applied them (connect errors, 429, 503), never after a 500 or a
+        # dropped response. The longest mounted prefix wins in requests.
+        write_adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_POOL_MAXSIZE,
+            max_retries=_retry(_WRITE_RETRY_STATUSES, idempotent=False),
+        )
+        for endpoint in WRITE_ENDPOINTS:
+            self._session.mount(self._base_url + endpoint, write_adapter)
+
+        # File downloads go to signed storage URLs on another host; they get
+        # their own pooled session so the API credentials are never sent there.
+        self._download_session = requests.Session()
+        self._download_session.mount(
+            "https://", HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+        )
+
+        # Created lazily on first paginated request (see _paginate)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Response cache for metadata resources: key -> (stored_at, value)
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
 
         # Initialize specialized resource endpoints
         self.jobs = JobsResource(self)
@@ -143,13 +330,27 @@ class AshbyClient:
         self.job_postings = JobPostingsResource(self)
         self.notes = NotesResource(self)
         self.feedback = FeedbackResource(self)
-        
-        # Initialize generic resources from registry
-        # This allows adding new endpoints with just one line in SIMPLE_RESOURCES
-        for attr_name, (model_class, endpoint, supports_get) in SIMPLE_RESOURCES.items():
-            setattr(self, attr_name, GenericResource(self, endpoint, model_class, supports_get))
 
-    def _request(self, endpoint: str, data: Optional[dict] = None) -> dict:
+    def __getattr__(self, name: str) -> GenericResource:
+        """
+        Lazily create generic resources from SIMPLE_RESOURCES on first access.
+
+        The resource is cached on the instance, so later lookups never reach
+        this method.
+        """
+        try:
+            model_class, endpoint, supports_get = SIMPLE_RESOURCES[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        resource = GenericResource(
+            self, endpoint, model_class, supports_get, cached=name in CACHED_RESOURCES
+        )
+        self.__dict__[name] = resource
+        return resource
+
+    def _request(self, endpoint: str, data: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
         Make a POST request to the Ashby API.
 
@@ -164,63 +365,148 @@ class AshbyClient:
             AshbyAuthError: If authentication fails
             AshbyAPIError: If the API returns an error
         """
-        url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.post(url, headers=self._headers, json=data or {})
-
-        if response.status_code == 401:
-            raise AshbyAuthError("Invalid or missing API key")
-        if response.status_code == 403:
-            raise AshbyAuthError("API key does not have permission for this endpoint")
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base_url + endpoint
+        body = _dumps(data) if data else _EMPTY_BODY
+        response = self._session.post(url, data=body)
 
+        _check_status(response)
         response.raise_for_status()
 
-        result = response.json()
-        if not result.get("success", False):
-            errors = result.get("errors", [])
-            error_info = result.get("errorInfo", {})
-            message = error_info.get("message") if error_info else None
-            if not message and errors:
-                message = str(errors)
-            if not message:
-                message = f"Unknown error (response: {result})"
-            raise AshbyAPIError(f"API error: {message}", errors=errors)
+        return _check_result(self._json_loads(response.content))
 
-        return result
+    def _cached_request(self, key: tuple[Any, ...], fn: Callable[[], T]) -> T:
+        """
+        Return a cached value for key, calling fn() on a miss or expiry.
 
-    def _paginate(
+        Args:
+            key: Hashable cache key
+            fn: Zero-argument callable producing the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        if self._cache_ttl <= 0:
+            return fn()
+        # Models keep raw_data or not per keep_raw(), so cache each variant apart
+        key = (*key, _keeping_raw())
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            cached: T = hit[1]
+            return cached
+        value = fn()
+        self._cache[key] = (now, value)
+        if len(self._cache) > _CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+        return value
+
+    def clear_cache(self) -> None:
+        """Drop all cached metadata responses."""
+        self._cache.clear()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._session.close()
+        self._download_session.close()
+
+    def __enter__(self) -> AshbyClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _paginate_pages(
         self,
         endpoint: str,
-        data: Optional[dict] = None,
+        data: Optional[dict[str, Any]] = None,
         limit: int = 100,
-    ) -> Generator[dict, None, None]:
+        prefetch: bool = True,
+    ) -> Generator[list[Any], None, None]:
         """
-        Paginate through all results from a list endpoint.
+        Paginate through a list endpoint, yielding one page of results at a time.
 
         Args:
             endpoint: API endpoint
             data: Additional request parameters
             limit: Number of results per page
+            prefetch: Fetch the next page in a background thread while the
+                current page is being consumed (default True)
 
         Yields:
-            Individual result items
+            Lists of result items, one per page
         """
-        request_data = data.copy() if data else {}
-        request_data["limit"] = limit
-        cursor = None
+        # A single request dict is reused for every page; only the cursor
+        # changes, and never while a request using it is still in flight.
+        request_data = {**(data or {}), "limit": limit}
+        response = self._request(endpoint, request_data)
+        next_page: Optional[Future[dict[str, Any]]] = None
+        seen_cursors: set[str] = set()
+
+        try:
+            while True:
+                # Stop unless the server gives us a cursor to continue from;
+                # a repeated cursor would otherwise loop forever.
+                results, next_cursor = _unpack_page(response)
+                more_data = next_cursor is not None
+                if next_cursor is not None:
+                    if next_cursor in seen_cursors:
+                        raise AshbyAPIError("Server returned duplicate pagination cursor")
+                    seen_cursors.add(next_cursor)
+                    request_data["cursor"] = next_cursor
+                    if prefetch:
+                        next_page = self._get_executor().submit(
+                            self._request, endpoint, request_data
+                        )
+
+                yield results
+
+                if not more_data:
+                    break
+
+                if next_page is not None:
+                    response = next_page.result()
+                    next_page = None
+                else:
+                    response = self._request(endpoint, request_data)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
-        while True:
-            if cursor:
-                request_data["cursor"] = cursor
-
-            response = self._request(endpoint, request_data)
-
-            for item in response.get("results", []):
-                yield item
+    def _paginate(
+        self,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Paginate through all results from a list endpoint.
 
-            if not response.get("moreDataAvailable", False):
-                break
+        Args:
+            endpoint: API endpoint
+            data: Additional request parameters
+            limit: Number of results per page
+            prefetch: Fetch the next page in a background thread while the
+                current page is being consumed (default True)
 
-            cursor = response.get("nextCursor")
+        Yields:
+            Individual result items
+        """
+        for page in self._paginate_pages(endpoint, data, limit, prefetch):
+            yield from page
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the single-worker executor used for page prefetching."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ashby-prefetch"
+            )
+        return self._executor
 
     # -------------------------------------------------------------------------
     # Convenience methods
@@ -233,6 +519,47 @@ class AshbyClient:
             application.candidate = self.candidates.get(application.candidate_id)
         return application
 
+    def get_applications_with_candidates(
+        self,
+        application_ids: list[str],
+        max_workers: int = 8,
+    ) -> list[Application]:
+        """
+        Get several applications with full candidate details populated.
+
+        Requests are issued concurrently over the client's connection pool;
+        each candidate lookup starts as soon as its application arrives.
+
+        Args:
+            application_ids: The application IDs to fetch
+            max_workers: Maximum number of concurrent requests (default 8,
+                capped at the connection pool size of 32)
+
+        Returns:
+            List of Application objects, in the same order as application_ids
+        """
+        applications: dict[str, Application] = {}
+        get_application = _in_caller_context(self.applications.get)
+        get_candidate = _in_caller_context(self.candidates.get)
+        # More workers than pooled connections would just churn sockets
+        max_workers = min(max_workers, _POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            app_futures = {
+                pool.submit(get_application, app_id): app_id
+                for app_id in application_ids
+            }
+            candidate_futures: dict[str, Future[Candidate]] = {}
+            for future in as_completed(app_futures):
+                application = future.result()
+                applications[app_futures[future]] = application
+                if application.candidate_id:
+                    candidate_futures[app_futures[future]] = pool.submit(
+                        get_candidate, application.candidate_id
+                    )
+            for app_id, candidate_future in candidate_futures.items():
+                applications[app_id].candidate = candidate_future.result()
+        return [applications[app_id] for app_id in application_ids]
+
     def download_resume(self, candidate: Candidate) -> Optional[tuple[bytes, str]]:
         """Download a candidate's resume if available."""
         if not candidate.resume_handle:
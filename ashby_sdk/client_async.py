@@ -0,0 +1,343 @@
+"""
+Async Ashby API Client
+
+Asyncio counterpart to AshbyClient, built on httpx. Requires the optional
+``async`` extra: ``pip install "ashby[async]"``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, Optional, TypeVar
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from ._json import dumps as _dumps
+from ._json import loads as _loads
+from .client import (
+    _CACHE_MAXSIZE,
+    _EMPTY_BODY,
+    _MAX_RETRIES,
+    _RETRY_STATUSES,
+    _WRITE_RETRY_STATUSES,
+    CACHED_RESOURCES,
+    SIMPLE_RESOURCES,
+    WRITE_ENDPOINTS,
+    _auth_header,
+    _check_result,
+    _check_status,
+    _retry_delay,
+    _unpack_page,
+)
+from .exceptions import AshbyAPIError, AshbyAuthError
+from .models import Application, _keeping_raw
+from .resources.async_resources import (
+    AsyncApplicationsResource,
+    AsyncCandidatesResource,
+    AsyncFilesResource,
+    AsyncGenericResource,
+    AsyncJobsResource,
+    AsyncSurveysResource,
+)
+from .resources.base import _POOL_MAXSIZE
+
+T = TypeVar("T")
+
+
+class AshbyAsyncClient:
+    """
+    Async client for interacting with the Ashby API.
+
+    Usage:
+        async with AshbyAsyncClient() as client:
+            jobs = await client.jobs.list(status=["Open"])
+            apps = await asyncio.gather(
+                *(client.applications.get(app_id) for app_id in app_ids)
+            )
+    """
+
+    BASE_URL = "https://api.ashbyhq.com"
+
+    # JSON decoder for response bodies; override to plug in a different parser
+    _json_loads = staticmethod(_loads)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = 300,
+        http2: bool = True,
+        max_concurrency: int = 32,
+    ):
+        """
+        Initialize the async Ashby client.
+
+        Args:
+            api_key: Ashby API key. If not provided, reads from ASHBY_API_KEY env var.
+            cache_ttl: Seconds to cache metadata lookups (default 300, 0 disables).
+            http2: Use HTTP/2 when the h2 package is installed (default True).
+            max_concurrency: Maximum number of requests in flight at once (default 32).
+
+        Raises:
+            AshbyAuthError: If no API key is provided or found in environment.
+            ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                'AshbyAsyncClient requires httpx. Install it with: pip install "ashby[async]"'
+            )
+
+        self.api_key = api_key or os.getenv("ASHBY_API_KEY")
+        if not self.api_key:
+            raise AshbyAuthError(
+                "API key is required. Provide it as argument or set ASHBY_API_KEY env var."
+            )
+
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                http2 = False
+
+        self._http = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            http2=http2,
+            # The semaphore caps in-flight requests, so more connections than
+            # that would never be used (with HTTP/2 they share one anyway).
+            limits=httpx.Limits(
+                max_keepalive_connections=max_concurrency,
+                max_connections=max_concurrency,
+            ),
+            headers={
+                "Authorization": _auth_header(self.api_key),
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            },
+        )
+
+        # File downloads go to signed storage URLs on another host; they get
+        # their own client so the API credentials are never sent there.
+        self._download_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=_POOL_MAXSIZE),
+            follow_redirects=True,
+        )
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        self._cache_ttl = cache_ttl
+        self._cache: dict[tuple[Any, ...], tuple[float, Any]] = {}
+
+        self.jobs = AsyncJobsResource(self)
+        self.applications = AsyncApplicationsResource(self)
+        self.candidates = AsyncCandidatesResource(self)
+        self.surveys = AsyncSurveysResource(self)
+        self.files = AsyncFilesResource(self)
+
+    def __getattr__(self, name: str) -> AsyncGenericResource:
+        """Lazily create generic resources from SIMPLE_RESOURCES on first access."""
+        try:
+            model_class, endpoint, supports_get = SIMPLE_RESOURCES[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+        resource = AsyncGenericResource(
+            self, endpoint, model_class, supports_get, cached=name in CACHED_RESOURCES
+        )
+        self.__dict__[name] = resource
+        return resource
+
+    async def _request(
+        self, endpoint: str, data: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """
+        Make a POST request to the Ashby API.
+
+        Rate limits and transient server errors are retried with the same
+        policy as AshbyClient: Retry-After is honored, otherwise the delay
+        backs off exponentially with jitter. Write endpoints are only
+        retried when the server cannot have applied them.
+
+        Args:
+            endpoint: API endpoint (e.g., "job.list")
+            data: Request body data
+
+        Returns:
+            Response JSON
+
+        Raises:
+            AshbyAuthError: If authentication fails
+            AshbyAPIError: If the API returns an error
+        """
+        url = f"/{endpoint}"
+        body = _dumps(data) if data else _EMPTY_BODY
+        is_write = endpoint in WRITE_ENDPOINTS
+        statuses = _WRITE_RETRY_STATUSES if is_write else _RETRY_STATUSES
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self._semaphore:
+                    response = await self._http.post(url, content=body)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # The request never reached the server
+                if attempt > _MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            except httpx.TransportError:
+                if is_write or attempt > _MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            if response.status_code not in statuses or attempt > _MAX_RETRIES:
+                break
+            await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+
+        _check_status(response)
+        response.raise_for_status()
+
+        return _check_result(self._json_loads(response.content))
+
+    async def _cached_request(self, key: tuple[Any, ...], fn: Callable[[], Awaitable[T]]) -> T:
+        """Return a cached value for key, awaiting fn() on a miss or expiry."""
+        if self._cache_ttl <= 0:
+            return await fn()
+        # Models keep raw_data or not per keep_raw(), so cache each variant apart
+        key = (*key, _keeping_raw())
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            cached: T = hit[1]
+            return cached
+        value = await fn()
+        self._cache[key] = (now, value)
+        if len(self._cache) > _CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+        return value
+
+    def clear_cache(self) -> None:
+        """Drop all cached metadata responses."""
+        self._cache.clear()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP clients and release pooled connections."""
+        await self._http.aclose()
+        await self._download_http.aclose()
+
+    async def __aenter__(self) -> AshbyAsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _paginate_pages(
+        self,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[list[Any], None]:
+        """
+        Paginate through a list endpoint, yielding one page of results at a time.
+
+        Args:
+            endpoint: API endpoint
+            data: Additional request parameters
+            limit: Number of results per page
+            prefetch: Start fetching the next page while the current page
+                is being consumed (default True)
+
+        Yields:
+            Lists of result items, one per page
+        """
+        request_data = {**(data or {}), "limit": limit}
+        response = await self._request(endpoint, request_data)
+        next_page: Optional[asyncio.Future[dict[str, Any]]] = None
+        seen_cursors: set[str] = set()
+
+        try:
+            while True:
+                results, next_cursor = _unpack_page(response)
+                more_data = next_cursor is not None
+                if next_cursor is not None:
+                    if next_cursor in seen_cursors:
+                        raise AshbyAPIError("Server returned duplicate pagination cursor")
+                    seen_cursors.add(next_cursor)
+                    request_data["cursor"] = next_cursor
+                    if prefetch:
+                        next_page = asyncio.ensure_future(self._request(endpoint, request_data))
+
+                yield results
+
+                if not more_data:
+                    break
+
+                if next_page is not None:
+                    response = await next_page
+                    next_page = None
+                else:
+                    response = await self._request(endpoint, request_data)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Paginate through all results from a list endpoint, one item at a time."""
+        async for page in self._paginate_pages(endpoint, data, limit, prefetch):
+            for item in page:
+                yield item
+
+    # -------------------------------------------------------------------------
+    # Convenience methods
+    # -------------------------------------------------------------------------
+
+    async def get_application_with_candidate(self, application_id: str) -> Application:
+        """Get an application with full candidate details populated."""
+        application = await self.applications.get(application_id)
+        if application.candidate_id:
+            application.candidate = await self.candidates.get(application.candidate_id)
+        return application
+
+    async def get_applications_with_candidates(
+        self,
+        application_ids: list[str],
+    ) -> list[Application]:
+        """Get several applications concurrently, with candidates populated."""
+        return list(
+            await asyncio.gather(
+                *(self.get_application_with_candidate(app_id) for app_id in application_ids)
+            )
+        )
+
+    async def list_applications_for_jobs(
+        self,
+        job_ids: list[str],
+    ) -> dict[str, list[Application]]:
+        """
+        List applications for several jobs concurrently.
+
+        Each job is paginated serially, but the jobs run in parallel
+        (bounded by max_concurrency).
+
+        Args:
+            job_ids: The job IDs
+
+        Returns:
+            Dict mapping each job ID to its applications
+        """
+        results = await asyncio.gather(
+            *(self.applications.list(job_id=job_id) for job_id in job_ids)
+        )
+        return dict(zip(job_ids, results, strict=True))
@@ -32,4 +32,6 @@ class AshbyNotFoundError(AshbyError):
 class AshbyRateLimitError(AshbyError):
     """Rate limit exceeded."""
 
-    pass
+    def __init__(self, message: str, retry_after: str | None = None):
+        self.retry_after = retry_after
+        super().__init__(message)
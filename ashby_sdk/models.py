@@ -5,12 +5,85 @@ These are lightweight dataclasses that wrap API responses
 and provide convenient access to common fields.
 """
 
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
+from sys import intern
+from types import MappingProxyType
 from typing import Any, Optional
 
+# Whether models keep a reference to their source dict in raw_data
+_KEEP_RAW = True
 
-@dataclass
+# Caller-scoped override of _KEEP_RAW set by keep_raw(); None defers to it
+_keep_raw_override: ContextVar[Optional[bool]] = ContextVar("keep_raw", default=None)
+
+# Shared read-only default for missing nested objects
+_EMPTY_DICT: Any = MappingProxyType({})
+
+_HTML_TAG_RE = re.compile(r"<[^<]+?>")
+
+# Feedback field titles (lowercased) that hold the overall recommendation
+_OVERALL_REC_TITLES = frozenset({"overall recommendation", "recommendation"})
+
+
+def set_keep_raw(keep: bool) -> None:
+    """
+    Choose whether models created from now on retain their API response.
+
+    Retaining it (the default) fills ``raw_data`` on every model. Turning it
+    off leaves ``raw_data`` empty, so large bulk-loaded collections don't
+    keep the whole parsed response alive alongside the models.
+
+    This sets the process-wide default; an enclosing keep_raw() block
+    takes precedence over it.
+
+    Args:
+        keep: True to fill raw_data, False to leave it empty
+    """
+    global _KEEP_RAW
+    _KEEP_RAW = keep
+
+
+@contextmanager
+def keep_raw(keep: bool) -> Iterator[None]:
+    """
+    Temporarily set raw_data retention, restoring the previous setting on exit.
+
+    Unlike set_keep_raw(), the setting only applies to the current thread or
+    asyncio task (and to the SDK's own worker threads started from it).
+
+    Example:
+        with models.keep_raw(False):
+            applications = client.applications.list()
+    """
+    token = _keep_raw_override.set(keep)
+    try:
+        yield
+    finally:
+        _keep_raw_override.reset(token)
+
+
+def _keeping_raw() -> bool:
+    """Return the raw_data setting in effect for the caller."""
+    keep = _keep_raw_override.get()
+    return _KEEP_RAW if keep is None else keep
+
+
+def _raw(data: dict) -> dict:
+    return data if _keeping_raw() else {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern low-cardinality enum-like strings so records share one copy."""
+    return intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class User:
     """Represents a user in Ashby."""
 
@@ -21,14 +94,23 @@ class User:
     global_role: Optional[str] = None
     is_enabled: Optional[bool] = None
 
+    # Fast path for complete records: every key fetched in one C call
+    _KEYS = itemgetter("id", "firstName", "lastName", "email", "globalRole", "isEnabled")
+
     @classmethod
     def from_dict(cls, data: dict) -> "User":
+        try:
+            id, first_name, last_name, email, global_role, is_enabled = cls._KEYS(data)
+        except KeyError:
+            pass
+        else:
+            return cls(id, first_name, last_name, email, _intern(global_role), is_enabled)
         return cls(
             id=data.get("id", ""),
             first_name=data.get("firstName", ""),
             last_name=data.get("lastName", ""),
             email=data.get("email", ""),
-            global_role=data.get("globalRole"),
+            global_role=_intern(data.get("globalRole")),
             is_enabled=data.get("isEnabled"),
         )
 
@@ -37,7 +119,7 @@ class User:
         return f"{self.first_name} {self.last_name}".strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class HiringTeamMember:
     """A member of a job's hiring team."""
 
@@ -47,18 +129,26 @@ class HiringTeamMember:
     email: str
     role: str
 
+    _KEYS = itemgetter("userId", "firstName", "lastName", "email", "role")
+
     @classmethod
     def from_dict(cls, data: dict) -> "HiringTeamMember":
+        try:
+            user_id, first_name, last_name, email, role = cls._KEYS(data)
+        except KeyError:
+            pass
+        else:
+            return cls(user_id, first_name, last_name, email, _intern(role))
         return cls(
             user_id=data.get("userId", ""),
             first_name=data.get("firstName", ""),
             last_name=data.get("lastName", ""),
             email=data.get("email", ""),
-            role=data.get("role", ""),
+            role=_intern(data.get("role", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Department:
     """Represents a department."""
 
@@ -66,8 +156,14 @@ class Department:
     name: str
     parent_id: Optional[str] = None
 
+    _KEYS = itemgetter("id", "name", "parentId")
+
     @classmethod
     def from_dict(cls, data: dict) -> "Department":
+        try:
+            return cls(*cls._KEYS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             name=data.get("name", ""),
@@ -75,7 +171,7 @@ class Department:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     """Represents a location."""
 
@@ -83,8 +179,14 @@ class Location:
     name: str
     is_remote: bool = False
 
+    _KEYS = itemgetter("id", "name", "isRemote")
+
     @classmethod
     def from_dict(cls, data: dict) -> "Location":
+        try:
+            return cls(*cls._KEYS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             name=data.get("name", ""),
@@ -92,7 +194,7 @@ class Location:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class File:
     """Represents a file (resume, attachment, etc.)."""
 
@@ -100,8 +202,14 @@ class File:
     name: str
     handle: str
 
+    _KEYS = itemgetter("id", "name", "handle")
+
     @classmethod
     def from_dict(cls, data: dict) -> "File":
+        try:
+            return cls(*cls._KEYS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             name=data.get("name", ""),
@@ -113,16 +221,12 @@ class File:
         """Create from a resumeFileHandle object."""
         if not data:
             return None
-        if isinstance(data, str):
-            return cls(id="", name="", handle=data)
-        return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            handle=data.get("handle", ""),
-        )
+        if type(data) is str:
+            return cls("", "", data)
+        return cls.from_dict(data)
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewStage:
     """Represents an interview stage in the hiring funnel."""
 
@@ -140,23 +244,23 @@ class InterviewStage:
         if not data:
             return None
         # Handle nested interviewStageGroup if present
-        stage_group = data.get("interviewStageGroup", {})
+        stage_group = data.get("interviewStageGroup") or _EMPTY_DICT
         return cls(
             id=data.get("id", ""),
-            name=data.get("title", "") or data.get("name", ""),
+            name=data.get("title") or data.get("name", ""),
             order_in_stage_group=data.get("orderInStageGroup") or data.get("orderInInterviewPlan"),
             stage_group_id=data.get("stageGroupId") or stage_group.get("id"),
             stage_group_name=stage_group.get("name"),
-            type=data.get("type"),
+            type=_intern(data.get("type")),
             interview_plan_id=data.get("interviewPlanId"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
     def __str__(self) -> str:
         return f"{self.name} (ID: {self.id})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     """Represents a candidate source."""
 
@@ -171,26 +275,32 @@ class Source:
         return cls(
             id=data.get("id", ""),
             name=data.get("name", ""),
-            type=data.get("type"),
+            type=_intern(data.get("type")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     """Represents a candidate tag."""
 
     id: str
     title: str
 
+    _KEYS = itemgetter("id", "title")
+
     @classmethod
     def from_dict(cls, data: dict) -> "Tag":
+        try:
+            return cls(*cls._KEYS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             title=data.get("title", ""),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailAddress:
     """Represents an email address."""
 
@@ -203,13 +313,13 @@ class EmailAddress:
         if not data:
             return None
         return cls(
-            value=data.get("value", ""),
-            type=data.get("type", ""),
-            is_primary=data.get("isPrimary", False),
+            data.get("value", ""),
+            _intern(data.get("type", "")),
+            data.get("isPrimary", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PhoneNumber:
     """Represents a phone number."""
 
@@ -222,28 +332,36 @@ class PhoneNumber:
         if not data:
             return None
         return cls(
-            value=data.get("value", ""),
-            type=data.get("type", ""),
-            is_primary=data.get("isPrimary", False),
+            data.get("value", ""),
+            _intern(data.get("type", "")),
+            data.get("isPrimary", False),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     """Represents a candidate link (LinkedIn, portfolio, etc.)."""
 
     url: str
     type: str
 
+    _KEYS = itemgetter("url", "type")
+
     @classmethod
     def from_dict(cls, data: dict) -> "Link":
+        try:
+            url, type = cls._KEYS(data)
+        except KeyError:
+            pass
+        else:
+            return cls(url, _intern(type))
         return cls(
             url=data.get("url", ""),
-            type=data.get("type", ""),
+            type=_intern(data.get("type", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomField:
     """Represents a custom field value."""
 
@@ -251,8 +369,14 @@ class CustomField:
     title: str
     value: Any
 
+    _KEYS = itemgetter("id", "title", "value")
+
     @classmethod
     def from_dict(cls, data: dict) -> "CustomField":
+        try:
+            return cls(*cls._KEYS(data))
+        except KeyError:
+            pass
         return cls(
             id=data.get("id", ""),
             title=data.get("title", ""),
@@ -260,7 +384,7 @@ class CustomField:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FormFieldSubmission:
     """A single field submission in an application form."""
 
@@ -271,17 +395,61 @@ class FormFieldSubmission:
     
     @classmethod
     def from_dict(cls, data: dict) -> "FormFieldSubmission":
-        field_info = data.get("field", {})
+        field_info = data.get("field") or _EMPTY_DICT
         return cls(
-            field_id=field_info.get("id", ""),
-            field_title=field_info.get("title", ""),
-            field_type=field_info.get("type", ""),
-            value=data.get("value"),
+            field_info.get("id", ""),
+            field_info.get("title", ""),
+            _intern(field_info.get("type", "")),
+            data.get("value"),
         )
 
 
-@dataclass
-class ApplicationFormSubmission:
+class _LazyIndex:
+    """
+    Case-insensitive lookup by title over a list of entries, indexed on first use.
+
+    Kept on a base class so the index is not a dataclass field and stays
+    out of fields(), asdict(), astuple(), repr and equality. The index is
+    rebuilt when the list is replaced or its length changes, and values are
+    read from the entries at lookup time; renaming an entry or replacing
+    one in place (same length) is not picked up.
+    """
+
+    __slots__ = ("_index", "_indexed")
+
+    _index: dict[str, Any]
+    _indexed: tuple[list[Any], int]
+
+    def _lookup(self, title: str) -> Any:
+        """Return the value for a title (case-insensitive), first occurrence winning."""
+        entries = self._entries()
+        try:
+            indexed, length = self._indexed
+            if indexed is not entries or length != len(entries):
+                raise AttributeError
+            index = self._index
+        except AttributeError:
+            index = self._index = {}
+            for entry in entries:
+                key = self._title_of(entry)
+                if key is not None:
+                    index.setdefault(key.lower(), entry)
+            self._indexed = (entries, len(entries))
+        entry = index.get(title.lower())
+        return None if entry is None else self._value_of(entry)
+
+    def _entries(self) -> list[Any]:
+        raise NotImplementedError
+
+    def _title_of(self, entry: Any) -> Optional[str]:
+        raise NotImplementedError
+
+    def _value_of(self, entry: Any) -> Any:
+        raise NotImplementedError
+
+
+@dataclass(slots=True)
+class ApplicationFormSubmission(_LazyIndex):
     """Application form submission data."""
 
     id: str
@@ -292,26 +460,29 @@ class ApplicationFormSubmission:
     def from_dict(cls, data: dict) -> Optional["ApplicationFormSubmission"]:
         if not data:
             return None
-        fields = [
-            FormFieldSubmission.from_dict(f)
-            for f in data.get("formSubmissionValue", [])
-        ]
+        fields = list(map(FormFieldSubmission.from_dict, data.get("formSubmissionValue") or ()))
         return cls(
             id=data.get("id", ""),
             fields=fields,
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
     def get_field_value(self, field_title: str) -> Any:
         """Get a field value by title (case-insensitive)."""
-        title_lower = field_title.lower()
-        for field in self.fields:
-            if field.field_title.lower() == title_lower:
-                return field.value
-        return None
+        return self._lookup(field_title)
+
+    def _entries(self) -> list[Any]:
+        return self.fields
+
+    def _title_of(self, entry: Any) -> Optional[str]:
+        title: str = entry.field_title
+        return title
 
+    def _value_of(self, entry: Any) -> Any:
+        return entry.value
 
-@dataclass
+
+@dataclass(slots=True)
 class JobPosting:
     """Represents a job posting with description and details."""
 
@@ -337,12 +508,12 @@ class JobPosting:
             location_ids=data.get("locationIds", []),
             is_listed=data.get("isListed", True),
             is_live=data.get("isLive", True),
-            employment_type=data.get("employmentType"),
+            employment_type=_intern(data.get("employmentType")),
             description_plain=data.get("descriptionPlain"),
             description_html=data.get("descriptionHtml"),
             published_at=data.get("publishedAt"),
             updated_at=data.get("updatedAt"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
     @property
@@ -351,12 +522,11 @@ class JobPosting:
         if self.description_plain:
             return self.description_plain
         if self.description_html:
-            import re
-            return re.sub('<[^<]+?>', ' ', self.description_html)
+            return _HTML_TAG_RE.sub(" ", self.description_html)
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """Represents a candidate note."""
 
@@ -372,10 +542,10 @@ class Note:
         return cls(
             id=data.get("id", ""),
             content=data.get("content", ""),
-            content_type=data.get("type", "text/plain"),
+            content_type=_intern(data.get("type", "text/plain")),
             created_at=data.get("createdAt"),
-            author=User.from_dict(data["author"]) if data.get("author") else None,
-            raw_data=data,
+            author=User.from_dict(user) if (user := data.get("author")) else None,
+            raw_data=_raw(data),
         )
 
 
@@ -384,7 +554,7 @@ class Note:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ArchiveReason:
     """Represents an archive/rejection reason for candidates."""
 
@@ -398,14 +568,14 @@ class ArchiveReason:
     def from_dict(cls, data: dict) -> "ArchiveReason":
         return cls(
             id=data.get("id", ""),
-            name=data.get("text", "") or data.get("name", ""),
-            reason_type=data.get("reasonType"),
+            name=data.get("text") or data.get("name", ""),
+            reason_type=_intern(data.get("reasonType")),
             is_archived=data.get("isArchived", False),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CloseReason:
     """Represents a reason for closing a job."""
 
@@ -418,13 +588,13 @@ class CloseReason:
     def from_dict(cls, data: dict) -> "CloseReason":
         return cls(
             id=data.get("id", ""),
-            name=data.get("text", "") or data.get("name", ""),
+            name=data.get("text") or data.get("name", ""),
             is_archived=data.get("isArchived", False),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents a talent pool/project."""
 
@@ -439,15 +609,15 @@ class Project:
     def from_dict(cls, data: dict) -> "Project":
         return cls(
             id=data.get("id", ""),
-            name=data.get("name", "") or data.get("title", ""),
+            name=data.get("name") or data.get("title", ""),
             is_archived=data.get("isArchived", False),
             is_confidential=data.get("isConfidential", False),
             created_at=data.get("createdAt"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Offer:
     """Represents a job offer."""
 
@@ -464,15 +634,15 @@ class Offer:
         return cls(
             id=data.get("id", ""),
             application_id=data.get("applicationId", ""),
-            status=data.get("status", ""),
+            status=_intern(data.get("status", "")),
             start_date=data.get("startDate"),
             created_at=data.get("createdAt"),
             updated_at=data.get("updatedAt"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Interview:
     """Represents a scheduled interview."""
 
@@ -490,16 +660,16 @@ class Interview:
         return cls(
             id=data.get("id", ""),
             application_id=data.get("applicationId"),
-            status=data.get("status"),
+            status=_intern(data.get("status")),
             interview_stage_id=data.get("interviewStageId"),
             scheduled_start_time=data.get("scheduledStartTime"),
             scheduled_end_time=data.get("scheduledEndTime"),
             created_at=data.get("createdAt"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewSchedule:
     """Represents an interview schedule."""
 
@@ -516,15 +686,15 @@ class InterviewSchedule:
         return cls(
             id=data.get("id", ""),
             application_id=data.get("applicationId"),
-            status=data.get("status"),
+            status=_intern(data.get("status")),
             scheduled_start_time=data.get("scheduledStartTime"),
             scheduled_end_time=data.get("scheduledEndTime"),
             created_at=data.get("createdAt"),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HiringTeamRole:
     """Represents a hiring team role type.
     
@@ -539,17 +709,17 @@ class HiringTeamRole:
     @classmethod
     def from_dict(cls, data) -> "HiringTeamRole":
         # Handle case where data is just a string (from hiringTeamRole.list)
-        if isinstance(data, str):
+        if type(data) is str:
             return cls(name=data, id="", raw_data={})
         # Handle case where data is a dict (from other endpoints)
         return cls(
             id=data.get("id", ""),
-            name=data.get("name", "") or data.get("title", ""),
-            raw_data=data,
+            name=data.get("name") or data.get("title", ""),
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomFieldDefinition:
     """Represents a custom field definition (not a value)."""
 
@@ -567,17 +737,17 @@ class CustomFieldDefinition:
         return cls(
             id=data.get("id", ""),
             title=data.get("title", ""),
-            field_type=data.get("fieldType", ""),
-            object_type=data.get("objectType"),
+            field_type=_intern(data.get("fieldType", "")),
+            object_type=_intern(data.get("objectType")),
             is_required=data.get("isRequired", False),
             is_archived=data.get("isArchived", False),
             selectable_values=data.get("selectableValues", []),
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
 
-@dataclass
-class Feedback:
+@dataclass(slots=True)
+class Feedback(_LazyIndex):
     """Represents interview feedback / scorecard."""
 
     id: str
@@ -594,20 +764,21 @@ class Feedback:
     def from_dict(cls, data: dict) -> "Feedback":
         # Try to extract overall recommendation from submitted values
         overall_rec = None
-        submitted_values = data.get("submittedValues", [])
+        submitted_values = data.get("submittedValues") or ()
         
         # Normalize submitted_values - handle both dict and string formats
+        # (decoded JSON, so exact type checks are enough)
         normalized_values = []
         for val in submitted_values:
-            if isinstance(val, dict):
+            if type(val) is dict:
                 normalized_values.append(val)
                 # Try to extract overall recommendation
-                field_info = val.get("field", {})
-                if isinstance(field_info, dict):
+                field_info = val.get("field") or _EMPTY_DICT
+                if type(field_info) is dict:
                     title = field_info.get("title", "").lower()
-                    if title in ("overall recommendation", "recommendation"):
+                    if title in _OVERALL_REC_TITLES:
                         overall_rec = val.get("value")
-            elif isinstance(val, str):
+            elif type(val) is str:
                 # Simple string value - convert to dict format
                 normalized_values.append({"value": val})
         
@@ -616,26 +787,34 @@ class Feedback:
             application_id=data.get("applicationId", ""),
             interview_id=data.get("interviewId"),
             submitted_at=data.get("submittedAt"),
-            submitter=User.from_dict(data["submitter"]) if data.get("submitter") else None,
+            submitter=User.from_dict(user) if (user := data.get("submitter")) else None,
             form_definition=data.get("formDefinition"),
             submitted_values=normalized_values,
             overall_recommendation=overall_rec,
-            raw_data=data,
+            raw_data=_raw(data),
         )
 
     def get_score(self, field_title: str) -> Any:
         """Get a score/value by field title (case-insensitive)."""
-        title_lower = field_title.lower()
-        for val in self.submitted_values:
-            if not isinstance(val, dict):
-                continue
-            field_info = val.get("field", {})
-            if isinstance(field_info, dict) and field_info.get("title", "").lower() == title_lower:
-                return val.get("value")
-        return None
+        return self._lookup(field_title)
+
+    def _entries(self) -> list[Any]:
+        return self.submitted_values
+
+    def _title_of(self, entry: Any) -> Optional[str]:
+        if not isinstance(entry, dict):
+            return None
+        field_info = entry.get("field") or _EMPTY_DICT
+        if not isinstance(field_info, dict):
+            return None
+        title: str = field_info.get("title", "")
+        return title
 
+    def _value_of(self, entry: Any) -> Any:
+        return entry.get("value")
 
-@dataclass
+
+@dataclass(slots=True)
 class Job:
     """Represents a job posting."""
 
@@ -657,30 +836,27 @@ class Job:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Job":
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            title=data.get("title", ""),
-            status=data.get("status", ""),
-            confidential=data.get("confidential", False),
-            employment_type=data.get("employmentType"),
-            department_id=data.get("departmentId"),
-            location_id=data.get("locationId"),
-            job_posting_ids=data.get("jobPostingIds", []),
-            hiring_team=[
-                HiringTeamMember.from_dict(m) for m in data.get("hiringTeam", [])
-            ],
-            custom_fields=[
-                CustomField.from_dict(f) for f in data.get("customFields", [])
-            ],
-            created_at=data.get("createdAt"),
-            updated_at=data.get("updatedAt"),
-            opened_at=data.get("openedAt"),
-            closed_at=data.get("closedAt"),
-            raw_data=data,
+            id=get("id", ""),
+            title=get("title", ""),
+            status=_intern(get("status", "")),
+            confidential=get("confidential", False),
+            employment_type=_intern(get("employmentType")),
+            department_id=get("departmentId"),
+            location_id=get("locationId"),
+            job_posting_ids=get("jobPostingIds", []),
+            hiring_team=list(map(HiringTeamMember.from_dict, get("hiringTeam") or ())),
+            custom_fields=list(map(CustomField.from_dict, get("customFields") or ())),
+            created_at=get("createdAt"),
+            updated_at=get("updatedAt"),
+            opened_at=get("openedAt"),
+            closed_at=get("closedAt"),
+            raw_data=_raw(data),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Candidate:
     """Represents a candidate."""
 
@@ -698,21 +874,20 @@ class Candidate:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Candidate":
-        resume_file = File.from_handle_obj(data.get("resumeFileHandle"))
+        get = data.get
+        resume_file = File.from_handle_obj(get("resumeFileHandle"))
         return cls(
-            id=data.get("id", ""),
-            name=data.get("name", ""),
-            primary_email=EmailAddress.from_dict(data.get("primaryEmailAddress")),
-            primary_phone=PhoneNumber.from_dict(data.get("primaryPhoneNumber")),
+            id=get("id", ""),
+            name=get("name", ""),
+            primary_email=EmailAddress.from_dict(get("primaryEmailAddress")),
+            primary_phone=PhoneNumber.from_dict(get("primaryPhoneNumber")),
             resume_file=resume_file,
-            links=[Link.from_dict(link) for link in data.get("links", [])],
-            tags=[Tag.from_dict(tag) for tag in data.get("tags", [])],
-            custom_fields=[
-                CustomField.from_dict(f) for f in data.get("customFields", [])
-            ],
-            created_at=data.get("createdAt"),
-            updated_at=data.get("updatedAt"),
-            raw_data=data,
+            links=list(map(Link.from_dict, get("links") or ())),
+            tags=list(map(Tag.from_dict, get("tags") or ())),
+            custom_fields=list(map(CustomField.from_dict, get("customFields") or ())),
+            created_at=get("createdAt"),
+            updated_at=get("updatedAt"),
+            raw_data=_raw(data),
         )
 
     @property
@@ -728,7 +903,7 @@ class Candidate:
         return self.resume_file.handle if self.resume_file else None
 
 
-@dataclass
+@dataclass(slots=True)
 class Application:
     """Represents a job application."""
 
@@ -754,30 +929,31 @@ class Application:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Application":
-        candidate_data = data.get("candidate", {})
-        archive_reason = data.get("archiveReason")
-        if isinstance(archive_reason, dict):
+        get = data.get
+        candidate_data = get("candidate") or _EMPTY_DICT
+        archive_reason = get("archiveReason")
+        if type(archive_reason) is dict:
             archive_reason = archive_reason.get("name")
             
         return cls(
-            id=data.get("id", ""),
-            status=data.get("status", ""),
+            id=get("id", ""),
+            status=_intern(get("status", "")),
             candidate_id=candidate_data.get("id", ""),
             candidate_name=candidate_data.get("name", ""),
-            job_id=data.get("jobId", ""),
-            is_archived=data.get("isArchived", False),
-            archive_reason=archive_reason,
-            current_stage=InterviewStage.from_dict(data.get("currentInterviewStage")),
-            source=Source.from_dict(data.get("source")),
+            job_id=get("jobId", ""),
+            is_archived=get("isArchived", False),
+            archive_reason=_intern(archive_reason),
+            current_stage=InterviewStage.from_dict(get("currentInterviewStage")),
+            source=Source.from_dict(get("source")),
             form_submission=ApplicationFormSubmission.from_dict(
-                data.get("applicationFormSubmission")
+                get("applicationFormSubmission")
             ),
-            form_submissions=data.get("applicationFormSubmissions", []),
-            credited_to=User.from_dict(data["creditedTo"]) if data.get("creditedTo") else None,
-            hired_at=data.get("hiredAt"),
-            created_at=data.get("createdAt"),
-            updated_at=data.get("updatedAt"),
-            raw_data=data,
+            form_submissions=get("applicationFormSubmissions", []),
+            credited_to=User.from_dict(user) if (user := get("creditedTo")) else None,
+            hired_at=get("hiredAt"),
+            created_at=get("createdAt"),
+            updated_at=get("updatedAt"),
+            raw_data=_raw(data),
         )
 
     @property
@@ -11,6 +11,15 @@ from .files import FilesResource
 from .job_postings import JobPostingsResource
 from .notes import NotesResource
 from .feedback import FeedbackResource
+from .async_resources import (
+    AsyncBaseResource,
+    AsyncGenericResource,
+    AsyncJobsResource,
+    AsyncApplicationsResource,
+    AsyncCandidatesResource,
+    AsyncSurveysResource,
+    AsyncFilesResource,
+)
 
 __all__ = [
     "BaseResource",
@@ -24,4 +33,12 @@ __all__ = [
     "JobPostingsResource",
     "NotesResource",
     "FeedbackResource",
+    # Async resources (used by AshbyAsyncClient)
+    "AsyncBaseResource",
+    "AsyncGenericResource",
+    "AsyncJobsResource",
+    "AsyncApplicationsResource",
+    "AsyncCandidatesResource",
+    "AsyncSurveysResource",
+    "AsyncFilesResource",
 ]
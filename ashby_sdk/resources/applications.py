@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from collections.abc import Generator
+from typing import Any, Optional
 
 from .base import BaseResource
 from ..models import Application
@@ -15,6 +16,7 @@ class ApplicationsResource(BaseResource):
         self,
         job_id: Optional[str] = None,
         limit: int = 100,
+        expand_forms: bool = False,
     ) -> list[Application]:
         """
         List applications.
@@ -22,16 +24,39 @@ class ApplicationsResource(BaseResource):
         Args:
             job_id: Filter by job ID (optional)
             limit: Results per page (default 100)
+            expand_forms: Include application form submissions in each page,
+                          saving a get_with_forms() call per application
 
         Returns:
             List of Application objects
         """
-        data = {}
+        return list(self.iter(job_id=job_id, limit=limit, expand_forms=expand_forms))
+
+    def iter(
+        self,
+        job_id: Optional[str] = None,
+        limit: int = 100,
+        expand_forms: bool = False,
+    ) -> Generator[Application, None, None]:
+        """
+        Iterate over applications, fetching pages as they are consumed.
+
+        Args:
+            job_id: Filter by job ID (optional)
+            limit: Results per page (default 100)
+            expand_forms: Include application form submissions in each page
+
+        Yields:
+            Application objects
+        """
+        data: dict[str, Any] = {}
         if job_id:
             data["jobId"] = job_id
-        return [
-            Application.from_dict(a) for a in self._paginate("application.list", data, limit)
-        ]
+        if expand_forms:
+            data["expand"] = ["applicationFormSubmissions"]
+        from_dict = Application.from_dict
+        for page in self._paginate_pages("application.list", data, limit):
+            yield from map(from_dict, page)
 
     def get(
         self,
@@ -48,7 +73,7 @@ class ApplicationsResource(BaseResource):
         Returns:
             Application object with full details
         """
-        data = {"applicationId": application_id}
+        data: dict[str, Any] = {"applicationId": application_id}
         if expand_forms:
             data["expand"] = ["applicationFormSubmissions"]
         response = self._request("application.info", data)
@@ -0,0 +1,305 @@
+"""
+Async API resources, used by AshbyAsyncClient.
+
+These cover the read paths the async client is used for. Submission
+parsing, filename handling and the candidate-filter checks are shared
+with the sync resource modules rather than copied.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
+from ..exceptions import AshbyAPIError, AshbyNotFoundError
+from ..models import Application, Candidate, Job
+from .files import _CHUNK_SIZE, _DOWNLOAD_TIMEOUT, _filename_from_disposition
+from .surveys import SubmissionParsingMixin, _filter_rejected
+
+if TYPE_CHECKING:
+    from ..client_async import AshbyAsyncClient
+
+# Raw survey submission dicts (spelled out here because resources define list())
+_Submissions = list[dict[str, Any]]
+
+
+class AsyncBaseResource:
+    """Base class for async API resources."""
+
+    def __init__(self, client: AshbyAsyncClient) -> None:
+        self._client = client
+
+    async def _request(
+        self, endpoint: str, data: Optional[dict[str, Any]] = None
+    ) -> dict[str, Any]:
+        """Make a request to the API."""
+        return await self._client._request(endpoint, data)
+
+    def _paginate_pages(
+        self,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+    ) -> AsyncGenerator[list[Any], None]:
+        """Paginate through API results one page at a time."""
+        return self._client._paginate_pages(endpoint, data, limit)
+
+    async def _list(
+        self,
+        model_class: Any,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+    ) -> list[Any]:
+        """Fetch every page of a list endpoint and deserialize the results."""
+        from_dict = model_class.from_dict
+        items: list[Any] = []
+        async for page in self._paginate_pages(endpoint, data, limit):
+            items.extend(map(from_dict, page))
+        return items
+
+    async def _info(self, model_class: Any, endpoint: str, data: dict[str, Any]) -> Any:
+        """Fetch a single record and deserialize it."""
+        response = await self._request(endpoint, data)
+        return model_class.from_dict(response.get("results", {}))
+
+
+class AsyncGenericResource(AsyncBaseResource):
+    """Async version of GenericResource for simple list/get endpoints."""
+
+    def __init__(
+        self,
+        client: AshbyAsyncClient,
+        endpoint: str,
+        model_class: Any,
+        supports_get: bool = False,
+        id_param: Optional[str] = None,
+        cached: bool = False,
+    ) -> None:
+        super().__init__(client)
+        self._endpoint = endpoint
+        self._model = model_class
+        self._supports_get = supports_get
+        self._id_param = id_param or f"{endpoint}Id"
+        self._cached = cached
+        self._list_endpoint = f"{endpoint}.list"
+        self._info_endpoint = f"{endpoint}.info"
+
+    async def list(self, limit: int = 100, **filters: Any) -> list[Any]:
+        """List all resources of this type."""
+        data = {k: v for k, v in filters.items() if v is not None}
+
+        async def fetch() -> list[Any]:
+            return await self._list(self._model, self._list_endpoint, data, limit)
+
+        if not self._cached:
+            return await fetch()
+        key = (self._list_endpoint, limit, repr(sorted(data.items())))
+        return list(await self._client._cached_request(key, fetch))
+
+    async def get(self, id: str) -> Any:
+        """
+        Get a single resource by ID.
+
+        Raises:
+            NotImplementedError: If this endpoint doesn't support get
+        """
+        if not self._supports_get:
+            raise NotImplementedError(
+                f"The {self._endpoint} endpoint does not support .info (get by ID)"
+            )
+
+        async def fetch() -> Any:
+            return await self._info(self._model, self._info_endpoint, {self._id_param: id})
+
+        if not self._cached:
+            return await fetch()
+        return await self._client._cached_request((self._info_endpoint, id), fetch)
+
+    @property
+    def endpoint(self) -> str:
+        """Return the endpoint name."""
+        return self._endpoint
+
+    @property
+    def model(self) -> Any:
+        """Return the model class."""
+        return self._model
+
+
+class AsyncJobsResource(AsyncBaseResource):
+    """Async API resource for jobs."""
+
+    async def list(
+        self,
+        status: Optional[list[str]] = None,
+        limit: int = 100,
+    ) -> list[Job]:
+        """List all jobs, optionally filtered by status."""
+        return await self._list(Job, "job.list", {"status": status} if status else {}, limit)
+
+    async def get(self, job_id: str) -> Job:
+        """Get a job by ID."""
+        job: Job = await self._info(Job, "job.info", {"id": job_id})
+        return job
+
+
+class AsyncApplicationsResource(AsyncBaseResource):
+    """Async API resource for applications."""
+
+    async def list(
+        self,
+        job_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> list[Application]:
+        """List applications, optionally filtered by job ID."""
+        return await self._list(
+            Application, "application.list", {"jobId": job_id} if job_id else {}, limit
+        )
+
+    async def get(self, application_id: str) -> Application:
+        """Get an application by ID."""
+        application: Application = await self._info(
+            Application, "application.info", {"applicationId": application_id}
+        )
+        return application
+
+
+class AsyncCandidatesResource(AsyncBaseResource):
+    """Async API resource for candidates."""
+
+    async def get(self, candidate_id: str) -> Candidate:
+        """Get a candidate by ID."""
+        candidate: Candidate = await self._info(Candidate, "candidate.info", {"id": candidate_id})
+        return candidate
+
+
+class AsyncSurveysResource(SubmissionParsingMixin, AsyncBaseResource):
+    """Async API resource for survey/questionnaire submissions."""
+
+    def __init__(self, client: AshbyAsyncClient) -> None:
+        super().__init__(client)
+        # Whether surveySubmission.list honors a candidateId filter;
+        # None until the first get_for_candidate() call finds out.
+        self._candidate_filter_supported: Optional[bool] = None
+
+    async def list(
+        self,
+        survey_type: str = "Questionnaire",
+        limit: int = 100,
+    ) -> _Submissions:
+        """List all survey submissions of a given type."""
+        submissions: _Submissions = []
+        async for page in self._paginate_pages(
+            "surveySubmission.list", {"surveyType": survey_type}, limit
+        ):
+            submissions.extend(page)
+        return submissions
+
+    async def get_for_candidate(
+        self,
+        candidate_id: str,
+        survey_type: str = "Questionnaire",
+        cached: bool = False,
+    ) -> _Submissions:
+        """
+        Get all survey submissions for a specific candidate.
+
+        Like SurveysResource.get_for_candidate(), the API's candidateId
+        filter is tried first, falling back to a scan of all submissions
+        (indexed and cached by candidate when *cached* is true).
+        """
+        if self._candidate_filter_supported is not False:
+            submissions = await self._list_filtered_by_candidate(candidate_id, survey_type)
+            if submissions is not None:
+                return submissions
+            self._candidate_filter_supported = False
+        if not cached:
+            return [
+                submission
+                for submission in await self.list(survey_type)
+                if submission.get("candidateId") == candidate_id
+            ]
+        index = await self._get_indexed_surveys(survey_type)
+        return copy.deepcopy(index.get(candidate_id, []))
+
+    async def _list_filtered_by_candidate(
+        self,
+        candidate_id: str,
+        survey_type: str,
+    ) -> Optional[_Submissions]:
+        """Ask the API to filter by candidate; None if it rejects or ignores the filter."""
+        submissions: _Submissions = []
+        try:
+            async for page in self._paginate_pages(
+                "surveySubmission.list",
+                {"surveyType": survey_type, "candidateId": candidate_id},
+            ):
+                for submission in page:
+                    if submission.get("candidateId") != candidate_id:
+                        return None
+                    submissions.append(submission)
+        except AshbyAPIError as e:
+            if not _filter_rejected(e):
+                raise
+            return None
+        return submissions
+
+    async def _get_indexed_surveys(self, survey_type: str) -> dict[Optional[str], _Submissions]:
+        """Get all submissions of a survey type grouped by candidate ID, via the cache."""
+
+        async def build() -> dict[Optional[str], _Submissions]:
+            return self._group_by_candidate(await self.list(survey_type))
+
+        return await self._client._cached_request(
+            ("surveySubmission.list", "byCandidate", survey_type), build
+        )
+
+
+class AsyncFilesResource(AsyncBaseResource):
+    """Async API resource for files."""
+
+    async def get_url(self, file_handle: str) -> str:
+        """Get the signed download URL for a file."""
+        response = await self._request("file.info", {"fileHandle": file_handle})
+        url: str = response.get("results", {}).get("url", "")
+        return url
+
+    async def download(
+        self,
+        file_handle: str,
+        dest: Optional[BinaryIO] = None,
+        *,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> tuple[bytes, str]:
+        """
+        Download a file by its handle.
+
+        Streams the body like FilesResource.download(); when *dest* is
+        given, chunks are written straight to it and empty bytes are
+        returned.
+
+        Returns:
+            Tuple of (file content bytes, filename)
+        """
+        url = await self.get_url(file_handle)
+        if not url:
+            raise AshbyNotFoundError("Could not get URL for file handle")
+
+        chunks: list[bytes] = []
+        write = dest.write if dest is not None else chunks.append
+        async with self._client._download_http.stream(
+            "GET", url, timeout=_DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+
+            filename = (
+                _filename_from_disposition(response.headers.get("content-disposition", ""))
+                or "downloaded_file"
+            )
+
+            async for chunk in response.aiter_bytes(chunk_size):
+                write(chunk)
+
+        return b"".join(chunks), filename
@@ -2,11 +2,34 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator, Optional
+import contextvars
+from collections.abc import Callable, Generator
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 if TYPE_CHECKING:
     from ..client import AshbyClient
 
+T = TypeVar("T")
+
+# Connections kept per host; concurrent helpers never use more workers than this
+_POOL_MAXSIZE = 32
+
+
+def _in_caller_context(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap fn to run on worker threads in a copy of the caller's context.
+
+    Threads start with an empty context, so without this, caller-scoped
+    settings such as models.keep_raw() would not reach work run in a pool.
+    Call it once per operation: the context is captured when it is called.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any) -> T:
+        return context.copy().run(fn, *args)
+
+    return run
+
 
 class BaseResource:
     """Base class for API resources."""
@@ -14,15 +37,24 @@ class BaseResource:
     def __init__(self, client: AshbyClient) -> None:
         self._client = client
 
-    def _request(self, endpoint: str, data: Optional[dict] = None) -> dict:
+    def _request(self, endpoint: str, data: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """Make a request to the API."""
         return self._client._request(endpoint, data)
 
     def _paginate(
         self,
         endpoint: str,
-        data: Optional[dict] = None,
+        data: Optional[dict[str, Any]] = None,
         limit: int = 100,
-    ) -> Generator[dict, None, None]:
+    ) -> Generator[dict[str, Any], None, None]:
         """Paginate through API results."""
         return self._client._paginate(endpoint, data, limit)
+
+    def _paginate_pages(
+        self,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        limit: int = 100,
+    ) -> Generator[list[Any], None, None]:
+        """Paginate through API results one page at a time."""
+        return self._client._paginate_pages(endpoint, data, limit)
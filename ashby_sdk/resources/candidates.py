@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import builtins
+from collections.abc import Generator
 from typing import Optional
 
 from .base import BaseResource
@@ -21,9 +23,21 @@ class CandidatesResource(BaseResource):
         Returns:
             List of Candidate objects
         """
-        return [
-            Candidate.from_dict(c) for c in self._paginate("candidate.list", limit=limit)
-        ]
+        return list(self.iter(limit=limit))
+
+    def iter(self, limit: int = 100) -> Generator[Candidate, None, None]:
+        """
+        Iterate over all candidates, fetching pages as they are consumed.
+
+        Args:
+            limit: Results per page (default 100)
+
+        Yields:
+            Candidate objects
+        """
+        from_dict = Candidate.from_dict
+        for page in self._paginate_pages("candidate.list", limit=limit):
+            yield from map(from_dict, page)
 
     def get(self, candidate_id: str) -> Candidate:
         """
@@ -42,7 +56,8 @@ class CandidatesResource(BaseResource):
         self,
         email: Optional[str] = None,
         name: Optional[str] = None,
-    ) -> list[Candidate]:
+        cached: bool = False,
+    ) -> builtins.list[Candidate]:
         """
         Search for candidates by email and/or name.
         
@@ -52,6 +67,9 @@ class CandidatesResource(BaseResource):
         Args:
             email: Email address to search for
             name: Name to search for
+            cached: Reuse the result of an identical search from the last
+                    cache_ttl seconds instead of querying again (default False;
+                    a cached miss won't see candidates created since)
             
         Returns:
             List of matching Candidate objects (max 100)
@@ -75,8 +93,14 @@ class CandidatesResource(BaseResource):
         if not data:
             raise ValueError("At least one of email or name must be provided")
         
-        response = self._request("candidate.search", data)
-        return [Candidate.from_dict(c) for c in response.get("results", [])]
+        def fetch() -> list[Candidate]:
+            response = self._request("candidate.search", data)
+            return list(map(Candidate.from_dict, response.get("results", [])))
+
+        if not cached:
+            return fetch()
+        # Copy so callers can't mutate the cached list
+        return list(self._client._cached_request(("candidate.search", email, name), fetch))
 
     def add_tag(self, candidate_id: str, tag_id: str) -> Candidate:
         """
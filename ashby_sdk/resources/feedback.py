@@ -34,4 +34,4 @@ class FeedbackResource(BaseResource):
             "applicationFeedback.list",
             {"applicationId": application_id}
         )
-        return [Feedback.from_dict(f) for f in response.get("results", [])]
+        return list(map(Feedback.from_dict, response.get("results", [])))
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-import requests
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
+from typing import BinaryIO, Optional
 
-from .base import BaseResource
+from .base import _POOL_MAXSIZE, BaseResource
 from ..exceptions import AshbyNotFoundError
 
+# Read size for streamed downloads
+_CHUNK_SIZE = 1 << 16
+
+# Seconds to wait for the storage host to connect or send the next chunk
+_DOWNLOAD_TIMEOUT = 30
+
 
 class FilesResource(BaseResource):
     """API resource for files."""
@@ -22,29 +32,125 @@ class FilesResource(BaseResource):
             Signed URL for downloading the file
         """
         response = self._request("file.info", {"fileHandle": file_handle})
-        return response.get("results", {}).get("url", "")
+        url: str = response.get("results", {}).get("url", "")
+        return url
 
-    def download(self, file_handle: str) -> tuple[bytes, str]:
+    def download(
+        self,
+        file_handle: str,
+        dest: Optional[BinaryIO] = None,
+        *,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> tuple[bytes, str]:
         """
         Download a file by its handle.
 
+        The body is streamed in chunks. When *dest* is given, chunks are
+        written straight to it and never held in memory as a whole.
+
         Args:
             file_handle: The file handle string
+            dest: Optional binary file-like object to write the content to
+            chunk_size: Bytes read from the connection per chunk (default 64 KiB)
 
         Returns:
-            Tuple of (file content bytes, filename)
+            Tuple of (file content bytes, filename). The bytes are empty
+            when *dest* is given.
         """
         url = self.get_url(file_handle)
         if not url:
             raise AshbyNotFoundError("Could not get URL for file handle")
 
-        response = requests.get(url)
-        response.raise_for_status()
+        chunks: list[bytes] = []
+        write = dest.write if dest is not None else chunks.append
+        with self._client._download_session.get(
+            url, stream=True, timeout=_DOWNLOAD_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+
+            filename = (
+                _filename_from_disposition(response.headers.get("content-disposition", ""))
+                or "downloaded_file"
+            )
+
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                write(chunk)
+
+        return b"".join(chunks), filename
+
+    def download_to_file(
+        self,
+        file_handle: str,
+        path: str | os.PathLike[str],
+        *,
+        chunk_size: int = _CHUNK_SIZE,
+    ) -> str:
+        """
+        Download a file by its handle straight to disk.
+
+        The body is streamed to a temporary file next to *path*, which is
+        moved into place only once the download completes, so a failed
+        download never leaves a truncated file at *path*.
+
+        Args:
+            file_handle: The file handle string
+            path: Destination file path
+            chunk_size: Bytes read from the connection per chunk (default 64 KiB)
+
+        Returns:
+            The filename reported by the server
+        """
+        directory, name = os.path.split(os.fspath(path))
+        # Created with open() rather than tempfile.mkstemp() so the file gets
+        # the usual umask-based permissions instead of owner-only 0600
+        tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.part")
+        with open(tmp_path, "xb") as f:
+            try:
+                _, filename = self.download(file_handle, dest=f, chunk_size=chunk_size)
+                f.close()
+                os.replace(tmp_path, path)
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        return filename
+
+    def download_many(
+        self,
+        file_handles: list[str],
+        max_workers: int = 8,
+    ) -> list[tuple[bytes, str]]:
+        """
+        Download several files concurrently.
+
+        Each file's URL lookup and download run on a worker thread, sharing
+        the client's pooled connections.
+
+        Args:
+            file_handles: The file handle strings
+            max_workers: Maximum number of concurrent downloads (default 8,
+                capped at the connection pool size of 32)
+
+        Returns:
+            List of (file content bytes, filename) tuples, in the same
+            order as file_handles
+        """
+        if not file_handles:
+            return []
+
+        max_workers = min(max_workers, len(file_handles), _POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.download, file_handles))
+
 
-        # Try to get filename from content-disposition header
-        content_disp = response.headers.get("content-disposition", "")
-        filename = "downloaded_file"
-        if "filename=" in content_disp:
-            filename = content_disp.split("filename=")[-1].strip('"')
+def _filename_from_disposition(content_disp: str) -> Optional[str]:
+    """
+    Extract the filename from a Content-Disposition header.
 
-        return response.content, filename
+    Handles quoted values and RFC 5987 ``filename*=UTF-8''...`` encoding.
+    """
+    if not content_disp:
+        return None
+    message = Message()
+    message["content-disposition"] = content_disp
+    return message.get_filename()
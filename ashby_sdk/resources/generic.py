@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Any
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any, Optional
 
 from .base import BaseResource
 
@@ -16,6 +17,7 @@ class GenericResource(BaseResource):
     
     This class handles the common patterns:
     - list(): Paginated list with optional filters
+    - iter(): Lazily stream the same results page by page
     - get(id): Fetch single resource by ID
     
     Usage:
@@ -32,9 +34,10 @@ class GenericResource(BaseResource):
         self,
         client: AshbyClient,
         endpoint: str,
-        model_class: type,
+        model_class: Any,
         supports_get: bool = False,
         id_param: Optional[str] = None,
+        cached: bool = False,
     ) -> None:
         """
         Initialize a generic resource.
@@ -46,6 +49,8 @@ class GenericResource(BaseResource):
             supports_get: Whether this endpoint supports .info (get by ID)
             id_param: Parameter name for the ID in .info calls (e.g., "departmentId").
                      If not provided, defaults to "{endpoint}Id".
+            cached: Whether list/get results may be served from the client's
+                    response cache (for rarely-changing metadata).
         """
         super().__init__(client)
         self._endpoint = endpoint
@@ -53,8 +58,12 @@ class GenericResource(BaseResource):
         self._supports_get = supports_get
         # Ashby uses {endpoint}Id for most .info endpoints (e.g., departmentId, locationId)
         self._id_param = id_param or f"{endpoint}Id"
+        self._cached = cached
+        # Endpoint names are fixed per resource; build them once
+        self._list_endpoint = f"{endpoint}.list"
+        self._info_endpoint = f"{endpoint}.info"
 
-    def list(self, limit: int = 100, **filters: Any) -> list:
+    def list(self, limit: int = 100, **filters: Any) -> list[Any]:
         """
         List all resources of this type.
         
@@ -63,14 +72,44 @@ class GenericResource(BaseResource):
             **filters: Optional filters to pass to the API
             
         Returns:
-            List of model instances
+            List of model instances. For cached resources the list is a
+            fresh copy, but the instances in it are shared with other
+            callers until the cache entry expires; copy one (e.g. with
+            dataclasses.replace()) before modifying it.
         """
         # Filter out None values from filters
         data = {k: v for k, v in filters.items() if v is not None}
-        return [
-            self._model.from_dict(item)
-            for item in self._paginate(f"{self._endpoint}.list", data, limit)
-        ]
+
+        def fetch() -> list[Any]:
+            from_dict = self._model.from_dict
+            items: list[Any] = []
+            for page in self._paginate_pages(self._list_endpoint, data, limit):
+                items.extend(map(from_dict, page))
+            return items
+
+        if not self._cached:
+            return fetch()
+        key = (self._list_endpoint, limit, repr(sorted(data.items())))
+        # Copy so callers can't mutate the cached list
+        return list(self._client._cached_request(key, fetch))
+
+    def iter(self, limit: int = 100, **filters: Any) -> Generator[Any, None, None]:
+        """
+        Iterate over resources of this type, fetching pages as they are consumed.
+
+        Unlike list(), results are never served from the response cache.
+
+        Args:
+            limit: Results per page (default 100)
+            **filters: Optional filters to pass to the API
+
+        Yields:
+            Model instances
+        """
+        data = {k: v for k, v in filters.items() if v is not None}
+        from_dict = self._model.from_dict
+        for page in self._paginate_pages(self._list_endpoint, data, limit):
+            yield from map(from_dict, page)
 
     def get(self, id: str) -> Any:
         """
@@ -80,7 +119,8 @@ class GenericResource(BaseResource):
             id: The resource ID
             
         Returns:
-            Model instance
+            Model instance (shared with other callers for cached resources,
+            like the instances returned by list())
             
         Raises:
             NotImplementedError: If this endpoint doesn't support get
@@ -89,8 +129,13 @@ class GenericResource(BaseResource):
             raise NotImplementedError(
                 f"The {self._endpoint} endpoint does not support .info (get by ID)"
             )
-        response = self._request(f"{self._endpoint}.info", {self._id_param: id})
-        return self._model.from_dict(response.get("results", {}))
+        def fetch() -> Any:
+            response = self._request(self._info_endpoint, {self._id_param: id})
+            return self._model.from_dict(response.get("results", {}))
+
+        if not self._cached:
+            return fetch()
+        return self._client._cached_request((self._info_endpoint, id), fetch)
 
     @property
     def endpoint(self) -> str:
@@ -98,6 +143,6 @@ class GenericResource(BaseResource):
         return self._endpoint
 
     @property
-    def model(self) -> type:
+    def model(self) -> Any:
         """Return the model class."""
         return self._model
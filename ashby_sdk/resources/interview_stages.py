@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import builtins
+
 from .base import BaseResource
 from ..models import InterviewStage
 
@@ -25,11 +27,10 @@ class InterviewStagesResource(BaseResource):
             List of InterviewStage objects
         """
         data = {"interviewPlanId": interview_plan_id}
-        stages = []
-        for s in self._paginate("interviewStage.list", data, limit):
-            stage = InterviewStage.from_dict(s)
-            if stage:
-                stages.append(stage)
+        from_dict = InterviewStage.from_dict
+        stages: list[InterviewStage] = []
+        for page in self._paginate_pages("interviewStage.list", data, limit):
+            stages.extend(filter(None, map(from_dict, page)))
         return stages
 
     def get(self, stage_id: str) -> InterviewStage:
@@ -45,7 +46,7 @@ class InterviewStagesResource(BaseResource):
         response = self._request("interviewStage.info", {"interviewStageId": stage_id})
         return InterviewStage.from_dict(response.get("results", {}))
 
-    def list_for_job(self, job_id: str) -> list[InterviewStage]:
+    def list_for_job(self, job_id: str) -> builtins.list[InterviewStage]:
         """
         Get all interview stages for a specific job.
 
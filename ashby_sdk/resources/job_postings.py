@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import builtins
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from typing import Optional
 
-from .base import BaseResource
+from .base import _POOL_MAXSIZE, BaseResource, _in_caller_context
 from ..models import JobPosting
 
 
@@ -30,35 +34,44 @@ class JobPostingsResource(BaseResource):
             The Ashby API does not filter by jobId server-side, so we filter
             client-side if job_id is provided.
         """
-        # Note: Ashby API ignores jobId filter, so we fetch all and filter client-side
-        all_postings = [
-            JobPosting.from_dict(p) for p in self._paginate("jobPosting.list", {}, limit)
-        ]
-        
-        if job_id:
-            return [p for p in all_postings if p.job_id == job_id]
-        return all_postings
-
-    def get(self, posting_id: str) -> JobPosting:
+        # Note: Ashby API ignores jobId filter, so we fetch all and filter client-side.
+        # Filter the raw page dicts so non-matching postings are never decoded.
+        from_dict = JobPosting.from_dict
+        postings: list[JobPosting] = []
+        for page in self._paginate_pages("jobPosting.list", {}, limit):
+            if job_id:
+                page = [p for p in page if p.get("jobId") == job_id]
+            postings.extend(map(from_dict, page))
+        return postings
+
+    def get(self, posting_id: str, cached: bool = False) -> JobPosting:
         """
         Get a job posting by ID.
 
         Args:
             posting_id: The job posting ID
+            cached: Reuse a lookup of the same posting from the last cache_ttl
+                    seconds instead of querying again (default False)
 
         Returns:
             JobPosting object with description
         """
-        response = self._request("jobPosting.info", {"jobPostingId": posting_id})
-        return JobPosting.from_dict(response.get("results", {}))
+        def fetch() -> JobPosting:
+            response = self._request("jobPosting.info", {"jobPostingId": posting_id})
+            return JobPosting.from_dict(response.get("results", {}))
+
+        if not cached:
+            return fetch()
+        return self._client._cached_request(("jobPosting.info", posting_id), fetch)
 
     def get_for_job(
         self,
         job_id: str,
         job_title: Optional[str] = None,
+        cached: bool = False,
     ) -> Optional[JobPosting]:
         """
-        Get the best-matching job posting for a job with full details.
+        Get the best-matching job posting for a job.
 
         When multiple postings exist for the same job (e.g. different titles
         for internal vs external listings), this method picks the posting
@@ -66,60 +79,137 @@ class JobPostingsResource(BaseResource):
         *job_title* is given — it falls back to the most-recently-updated
         posting.
 
+        If the listing already carries the plain text description, the
+        listed posting is returned as is, without a ``jobPosting.info``
+        call; fields that only the detail endpoint returns may then be
+        unset.
+
         Args:
             job_id: The job ID
             job_title: The canonical job title used for matching.
                        When called via :meth:`get_description` this is
                        looked up automatically.
+            cached: Reuse the posting list and posting lookups from the
+                    last cache_ttl seconds (default False)
 
         Returns:
-            JobPosting object with description, or None if no postings exist
+            JobPosting object with at least the plain text description when
+            the API has one, or None if no postings exist
         """
-        postings = self.list(job_id=job_id)
-        if not postings:
-            return None
-
-        # Only one posting — no ambiguity
-        if len(postings) == 1:
-            return self.get(postings[0].id)
-
-        # Try exact title match first
-        if job_title:
-            for p in postings:
-                if p.title == job_title:
-                    return self.get(p.id)
+        return self._pick_posting(self._list_for_job(job_id, cached), job_title, cached)
 
-        # Fallback: most recently updated posting
-        postings.sort(
-            key=lambda p: p.updated_at or "",
-            reverse=True,
-        )
-        return self.get(postings[0].id)
-
-    def get_description(self, job_id: str) -> Optional[str]:
+    def get_description(self, job_id: str, cached: bool = False) -> Optional[str]:
         """
         Get the job description for a job.
 
         Convenience method that fetches the job posting and returns
-        the plain text description.  Automatically resolves the correct
-        posting when multiple postings exist for the same job by looking
-        up the job title via the jobs API.
+        the plain text description.  When multiple postings exist for the
+        same job, the correct one is resolved by looking up the job title
+        via the jobs API.
 
         Args:
             job_id: The job ID
+            cached: Reuse job and posting lookups from the last cache_ttl
+                    seconds, e.g. when called once per application of the
+                    same job (default False)
 
         Returns:
             Plain text job description or None
         """
-        # Look up the canonical job title so we can match the right posting
+        return self._describe(job_id, self._list_for_job(job_id, cached), cached)
+
+    def get_descriptions(
+        self,
+        job_ids: builtins.list[str],
+        max_workers: int = 8,
+    ) -> dict[str, Optional[str]]:
+        """
+        Get the job descriptions for several jobs.
+
+        The posting list is read once for all jobs (instead of once per
+        job); the remaining per-job lookups run concurrently over the
+        client's pooled connections.
+
+        Args:
+            job_ids: The job IDs
+            max_workers: Maximum number of concurrent requests (default 8,
+                capped at the connection pool size of 32)
+
+        Returns:
+            Dict mapping each job ID to its plain text description or None
+        """
+        if not job_ids:
+            return {}
+
+        wanted: set[str] = set(job_ids)
+        from_dict = JobPosting.from_dict
+        by_job: defaultdict[str, list[JobPosting]] = defaultdict(list)
+        for page in self._paginate_pages("jobPosting.list", {}):
+            for p in page:
+                if p.get("jobId") in wanted:
+                    by_job[p["jobId"]].append(from_dict(p))
+
+        @_in_caller_context
+        def describe(job_id: str) -> Optional[str]:
+            return self._describe(job_id, by_job.get(job_id, []), False)
+
+        max_workers = min(max_workers, len(job_ids), _POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(job_ids, pool.map(describe, job_ids), strict=True))
+
+    def _describe(
+        self,
+        job_id: str,
+        postings: builtins.list[JobPosting],
+        cached: bool,
+    ) -> Optional[str]:
+        """Pick a job's posting from its listed postings and return its description."""
+        # Look up the canonical job title so we can match the right posting;
+        # with a single posting there is nothing to disambiguate
         job_title: Optional[str] = None
-        try:
-            from .jobs import JobsResource
-            jobs_resource = JobsResource(self._client)
-            job = jobs_resource.get(job_id)
-            job_title = job.title
-        except Exception:
-            pass
-
-        posting = self.get_for_job(job_id, job_title=job_title)
+        if len(postings) > 1:
+            with suppress(Exception):
+                job_title = self._client.jobs.get(job_id, cached=cached).title
+
+        posting = self._pick_posting(postings, job_title, cached)
         return posting.description if posting else None
+
+    def _list_for_job(self, job_id: str, cached: bool) -> builtins.list[JobPosting]:
+        """List a job's postings, through the response cache if requested."""
+        if not cached:
+            return self.list(job_id=job_id)
+        return self._client._cached_request(
+            ("jobPosting.list", job_id), lambda: self.list(job_id=job_id)
+        )
+
+    def _pick_posting(
+        self,
+        postings: builtins.list[JobPosting],
+        job_title: Optional[str],
+        cached: bool,
+    ) -> Optional[JobPosting]:
+        """Choose the posting matching job_title (else the newest) and fetch its details."""
+        if not postings:
+            return None
+
+        # Only one posting — no ambiguity
+        if len(postings) == 1:
+            return self._with_details(postings[0], cached)
+
+        # Try exact title match first
+        if job_title:
+            for p in postings:
+                if p.title == job_title:
+                    return self._with_details(p, cached)
+
+        # Fallback: most recently updated posting. updatedAt is ISO-8601 UTC,
+        # so comparing the raw strings orders them without parsing datetimes.
+        newest = max(postings, key=lambda p: p.updated_at or "")
+        return self._with_details(newest, cached)
+
+    def _with_details(self, posting: JobPosting, cached: bool) -> JobPosting:
+        """Return posting as-is if the listing already carried its plain-text description."""
+        # An HTML-only listing still needs jobPosting.info for descriptionPlain
+        if posting.description_plain:
+            return posting
+        return self.get(posting.id, cached=cached)
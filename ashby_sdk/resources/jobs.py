@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import builtins
+from collections.abc import Generator
 from typing import Optional
 
 from .base import BaseResource
@@ -26,20 +28,47 @@ class JobsResource(BaseResource):
         Returns:
             List of Job objects
         """
+        return list(self.iter(status=status, limit=limit))
+
+    def iter(
+        self,
+        status: Optional[builtins.list[str]] = None,
+        limit: int = 100,
+    ) -> Generator[Job, None, None]:
+        """
+        Iterate over all jobs, fetching pages as they are consumed.
+
+        Args:
+            status: Filter by status (e.g., ["Open", "Closed", "Draft", "Archived"])
+            limit: Results per page (default 100)
+
+        Yields:
+            Job objects
+        """
         data = {}
         if status:
             data["status"] = status
-        return [Job.from_dict(j) for j in self._paginate("job.list", data, limit)]
+        from_dict = Job.from_dict
+        for page in self._paginate_pages("job.list", data, limit):
+            yield from map(from_dict, page)
 
-    def get(self, job_id: str) -> Job:
+    def get(self, job_id: str, cached: bool = False) -> Job:
         """
         Get a job by ID.
 
         Args:
             job_id: The job ID
+            cached: Reuse a lookup of the same job from the last cache_ttl
+                    seconds instead of querying again (default False)
 
         Returns:
             Job object
         """
-        response = self._request("job.info", {"id": job_id})
-        return Job.from_dict(response.get("results", {}))
+
+        def fetch() -> Job:
+            response = self._request("job.info", {"id": job_id})
+            return Job.from_dict(response.get("results", {}))
+
+        if not cached:
+            return fetch()
+        return self._client._cached_request(("job.info", job_id), fetch)
@@ -51,11 +51,12 @@ class NotesResource(BaseResource):
         Returns:
             List of Note objects
         """
-        return [
-            Note.from_dict(n)
-            for n in self._paginate(
-                "candidate.listNotes",
-                {"candidateId": candidate_id},
-                limit
-            )
-        ]
+        from_dict = Note.from_dict
+        notes: list[Note] = []
+        for page in self._paginate_pages(
+            "candidate.listNotes",
+            {"candidateId": candidate_id},
+            limit
+        ):
+            notes.extend(map(from_dict, page))
+        return notes
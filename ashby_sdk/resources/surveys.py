@@ -2,17 +2,167 @@
 
 from __future__ import annotations
 
+import builtins
+import copy
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..exceptions import AshbyAPIError
 from .base import BaseResource
 
+if TYPE_CHECKING:
+    from ..client import AshbyClient
+
+# System fields to skip (these are basic info, not questionnaire answers)
+_SKIP_FIELDS: frozenset[str] = frozenset({
+    "_systemfield_resume",
+    "_systemfield_pre_parsed_resume",
+    "_systemfield_name",
+    "_systemfield_email",
+    "_systemfield_phone",
+})
+
+_SYSTEMFIELD_PREFIX = "_systemfield_"
+
+# Error codes meaning the API refused the candidateId filter parameter
+_FILTER_REJECTED_ERRORS: frozenset[str] = frozenset({"invalid_input"})
+
+# Shared read-only defaults for missing (or null) keys, so parsing doesn't
+# allocate a fresh empty container for every absent field
+_EMPTY_DICT: Any = MappingProxyType({})
+_EMPTY_LIST: tuple[Any, ...] = ()
+
+
+class SubmissionParsingMixin:
+    """Submission parsing shared by the sync and async survey resources."""
+
+    def parse_submission(
+        self,
+        submission: dict[str, Any],
+        field_map: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        """
+        Parse a survey or application form submission into a readable format.
+
+        Works for both surveySubmission and applicationFormSubmissions data.
+
+        Args:
+            submission: Raw submission dict (from survey or application form)
+            field_map: Prebuilt field ID/path -> title mapping for the
+                       submission's form (built from formDefinition if omitted)
+
+        Returns:
+            Dict with field titles mapped to values
+        """
+        if field_map is None:
+            field_map = _build_field_map(submission.get("formDefinition") or _EMPTY_DICT)
+
+        # Map submitted values to titles
+        result: dict[str, Any] = {
+            "submitted_at": submission.get("submittedAt"),
+            "candidate_id": submission.get("candidateId"),
+            "application_id": submission.get("applicationId"),
+            "survey_type": submission.get("surveyType"),
+            "form_id": submission.get("id"),
+            "answers": {},
+        }
+
+        answers: dict[str, Any] = result["answers"]
+        submitted = submission.get("submittedValues") or _EMPTY_DICT
+        for field_key, value in submitted.items():
+            # Skip system fields that contain basic candidate info
+            if field_key in _SKIP_FIELDS:
+                continue
+            if field_key not in field_map and field_key.startswith(_SYSTEMFIELD_PREFIX):
+                continue
+            title = field_map.get(field_key, field_key)
+
+            # Format value (decoded JSON, so exact type lookup is enough)
+            formatter = _FORMATTERS.get(type(value))
+            answers[title] = formatter(value) if formatter else value
+
+        return result
+
+    def make_submission_parser(
+        self,
+        form_definition: dict[str, Any],
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """
+        Build a parser bound to a single form definition.
+
+        The field map is built once, so parsing many submissions of the
+        same form skips re-walking its sections on every call.
+
+        Args:
+            form_definition: The shared formDefinition dict
+
+        Returns:
+            Function taking a raw submission and returning its parsed dict
+
+        Example:
+            parse = client.surveys.make_submission_parser(form_def)
+            parsed = [parse(s) for s in submissions]
+        """
+        field_map = _build_field_map(form_definition)
+        parse_submission = self.parse_submission
+
+        def parse(submission: dict[str, Any]) -> dict[str, Any]:
+            return parse_submission(submission, field_map)
+
+        return parse
+
+    def parse_submissions(self, submissions: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Parse many submissions, building each form's field map only once.
+
+        Consecutive submissions that share a form definition object (as in
+        one listing of a form's submissions) reuse a single bound parser
+        from make_submission_parser().
+
+        Args:
+            submissions: Raw submission dicts
+
+        Returns:
+            List of parsed submissions, in input order
+        """
+        last_form_def: Optional[dict[str, Any]] = None
+        parse: Callable[[dict[str, Any]], dict[str, Any]] = self.parse_submission
+        parsed = []
+        for submission in submissions:
+            form_def = submission.get("formDefinition") or _EMPTY_DICT
+            if form_def is not last_form_def:
+                parse = self.make_submission_parser(form_def)
+                last_form_def = form_def
+            parsed.append(parse(submission))
+        return parsed
+
+    def _group_by_candidate(
+        self,
+        submissions: Iterable[dict[str, Any]],
+    ) -> dict[Optional[str], list[dict[str, Any]]]:
+        """Group submissions by candidate ID; those without one go under None."""
+        index: defaultdict[Optional[str], list[dict[str, Any]]] = defaultdict(list)
+        for submission in submissions:
+            index[submission.get("candidateId")].append(submission)
+        return dict(index)
+
 
-class SurveysResource(BaseResource):
+class SurveysResource(SubmissionParsingMixin, BaseResource):
     """API resource for survey/questionnaire submissions."""
 
+    def __init__(self, client: AshbyClient) -> None:
+        super().__init__(client)
+        # Whether surveySubmission.list honors a candidateId filter;
+        # None until the first get_for_candidate() call finds out.
+        self._candidate_filter_supported: Optional[bool] = None
+
     def list(
         self,
         survey_type: str = "Questionnaire",
         limit: int = 100,
-    ) -> list[dict]:
+    ) -> list[dict[str, Any]]:
         """
         List all survey submissions of a given type.
 
@@ -23,98 +173,163 @@ class SurveysResource(BaseResource):
         Returns:
             List of survey submission dicts
         """
-        return list(self._paginate(
+        return list(self.iter(survey_type=survey_type, limit=limit))
+
+    def iter(
+        self,
+        survey_type: str = "Questionnaire",
+        limit: int = 100,
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Iterate over survey submissions of a given type, fetching pages as they are consumed.
+
+        Args:
+            survey_type: Type of survey (default "Questionnaire")
+            limit: Results per page (default 100)
+
+        Yields:
+            Survey submission dicts
+        """
+        return self._paginate(
             "surveySubmission.list",
             {"surveyType": survey_type},
             limit
-        ))
+        )
 
     def get_for_candidate(
         self,
         candidate_id: str,
         survey_type: str = "Questionnaire",
-    ) -> list[dict]:
+        cached: bool = False,
+    ) -> builtins.list[dict[str, Any]]:
         """
         Get all survey submissions for a specific candidate.
 
+        The API's candidateId filter is tried first. If the API does not
+        support it, the full submission list is scanned instead.
+
         Args:
             candidate_id: The candidate ID
             survey_type: Type of survey (default "Questionnaire")
+            cached: When falling back to a full scan, index all submissions
+                    by candidate and reuse that index for cache_ttl seconds
+                    (default False; a cached index won't see submissions
+                    made since)
 
         Returns:
             List of survey submissions for this candidate
         """
-        all_surveys = self.list(survey_type=survey_type)
-        return [s for s in all_surveys if s.get("candidateId") == candidate_id]
+        if self._candidate_filter_supported is not False:
+            submissions = self._list_filtered_by_candidate(candidate_id, survey_type)
+            if submissions is not None:
+                return submissions
+            self._candidate_filter_supported = False
+        if not cached:
+            return [
+                submission
+                for submission in self.iter(survey_type)
+                if submission.get("candidateId") == candidate_id
+            ]
+        # Deep copy so callers can't mutate the cached submissions
+        return copy.deepcopy(self._get_indexed_surveys(survey_type).get(candidate_id, []))
 
-    def parse_submission(self, submission: dict) -> dict:
+    def _list_filtered_by_candidate(
+        self,
+        candidate_id: str,
+        survey_type: str,
+    ) -> Optional[builtins.list[dict[str, Any]]]:
         """
-        Parse a survey or application form submission into a readable format.
+        Ask the API to filter submissions by candidate.
 
-        Works for both surveySubmission and applicationFormSubmissions data.
+        Returns None if the API rejects the candidateId parameter or ignores
+        it (i.e. submissions for other candidates come back). An ignored
+        filter shows up on the first page, so that probe costs one request;
+        when the filter works, every page of the candidate's submissions
+        is read.
 
-        Args:
-            submission: Raw submission dict (from survey or application form)
+        Raises:
+            AshbyAPIError: For any error other than rejecting the parameter
+        """
+        submissions = []
+        try:
+            for page in self._paginate_pages(
+                "surveySubmission.list",
+                {"surveyType": survey_type, "candidateId": candidate_id},
+            ):
+                for submission in page:
+                    if submission.get("candidateId") != candidate_id:
+                        return None
+                    submissions.append(submission)
+        except AshbyAPIError as e:
+            if not _filter_rejected(e):
+                raise
+            return None
+        return submissions
 
-        Returns:
-            Dict with field titles mapped to values
+    def _get_indexed_surveys(
+        self,
+        survey_type: str,
+    ) -> dict[Optional[str], builtins.list[dict[str, Any]]]:
         """
-        # Build field ID -> title mapping
-        field_map = {}
-        form_def = submission.get("formDefinition", {})
-        for section in form_def.get("sections", []):
-            for field_def in section.get("fields", []):
-                field = field_def.get("field", {})
-                field_id = field.get("id")
-                field_title = field.get("title")
-                field_path = field.get("path", "")
-                if field_id:
-                    field_map[field_id] = field_title
-                if field_path:
-                    field_map[field_path] = field_title
+        Get all submissions of a survey type, grouped by candidate ID.
 
-        # Map submitted values to titles
-        result = {
-            "submitted_at": submission.get("submittedAt"),
-            "candidate_id": submission.get("candidateId"),
-            "application_id": submission.get("applicationId"),
-            "survey_type": submission.get("surveyType"),
-            "form_id": submission.get("id"),
-            "answers": {},
-        }
+        The index is built with a single pass over the paginated list and
+        kept in the client's response cache, so looking up many candidates
+        with cached=True does not re-download the whole survey corpus each
+        time.
+        """
+        def build() -> dict[Optional[str], list[dict[str, Any]]]:
+            return self._group_by_candidate(self.iter(survey_type))
 
-        # System fields to skip (these are basic info, not questionnaire answers)
-        skip_fields = {
-            "_systemfield_resume",
-            "_systemfield_pre_parsed_resume",
-            "_systemfield_name",
-            "_systemfield_email",
-            "_systemfield_phone",
-        }
+        return self._client._cached_request(
+            ("surveySubmission.list", "byCandidate", survey_type), build
+        )
 
-        submitted = submission.get("submittedValues", {})
-        for field_key, value in submitted.items():
-            title = field_map.get(field_key, field_key)
 
-            # Skip system fields that contain basic candidate info
-            if field_key in skip_fields:
-                continue
-            if field_key.startswith("_systemfield_") and field_key not in field_map:
-                continue
+def _format_dict(value: dict[str, Any]) -> Any:
+    """Use the text or name of an option-like answer."""
+    if "text" in value:
+        return value.get("text")
+    if "name" in value:
+        return value.get("name")
+    return value
 
-            # Format value
-            if isinstance(value, dict):
-                if "text" in value:
-                    value = value.get("text")
-                elif "name" in value:
-                    value = value.get("name")
-            elif isinstance(value, bool):
-                value = "Yes" if value else "No"
-            elif isinstance(value, list):
-                value = ", ".join(
-                    str(v.get("name", v) if isinstance(v, dict) else v) for v in value
-                )
-
-            result["answers"][title] = value
 
-        return result
+def _format_bool(value: bool) -> str:
+    return "Yes" if value else "No"
+
+
+def _format_list(value: list[Any]) -> str:
+    """Join multi-select answers into a comma-separated string."""
+    return ", ".join(
+        str(v.get("name", v) if isinstance(v, dict) else v) for v in value
+    )
+
+
+# Answer formatters keyed by the exact type of the submitted value
+_FORMATTERS: dict[type, Callable[[Any], Any]] = {
+    dict: _format_dict,
+    bool: _format_bool,
+    list: _format_list,
+}
+
+
+def _filter_rejected(error: AshbyAPIError) -> bool:
+    """Whether an API error means the candidateId filter parameter was refused."""
+    return not _FILTER_REJECTED_ERRORS.isdisjoint(error.errors)
+
+
+def _build_field_map(form_def: dict[str, Any]) -> dict[str, str]:
+    """Build a field ID/path -> title mapping from a form definition."""
+    field_map = {}
+    for section in form_def.get("sections") or _EMPTY_LIST:
+        for field_def in section.get("fields") or _EMPTY_LIST:
+            field = field_def.get("field") or _EMPTY_DICT
+            field_id = field.get("id")
+            field_title = field.get("title")
+            field_path = field.get("path", "")
+            if field_id:
+                field_map[field_id] = field_title
+            if field_path:
+                field_map[field_path] = field_title
+    return field_map
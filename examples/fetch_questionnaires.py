@@ -8,6 +8,8 @@ Demonstrates how to get form data from both sources:
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+
 from ashby_sdk import AshbyClient
 
 
@@ -17,14 +19,12 @@ def get_all_form_data(client: AshbyClient, application_id: str, candidate_id: st
 
     # Source 1: Application form submissions (newer candidates)
     app = client.applications.get_with_forms(application_id)
-    for form_sub in app.form_submissions:
-        parsed = client.surveys.parse_submission(form_sub)
-        all_answers.update(parsed.get("answers", {}))
 
     # Source 2: Survey submissions (older candidates)
     surveys = client.surveys.get_for_candidate(candidate_id)
-    for survey in surveys:
-        parsed = client.surveys.parse_submission(survey)
+
+    # parse_submissions builds each form's field map once for all submissions
+    for parsed in client.surveys.parse_submissions([*app.form_submissions, *surveys]):
         all_answers.update(parsed.get("answers", {}))
 
     return all_answers
@@ -50,12 +50,19 @@ def main():
     print(f"Job: {job.title}")
     print(f"Applications: {len(applications)}\n")
 
-    # Check first few candidates for form data
+    # Check first few candidates for form data, fetching them concurrently
+    # (results still come back in application order)
+    first_apps = applications[:10]
     found_data = False
-    for app in applications[:10]:
-        answers = get_all_form_data(client, app.id, app.candidate_id)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        all_answers = pool.map(
+            lambda app: get_all_form_data(client, app.id, app.candidate_id),
+            first_apps,
+        )
+        for app, answers in zip(first_apps, all_answers, strict=True):
+            if not answers:
+                continue
 
-        if answers:
             print(f"Candidate: {app.candidate_name}")
             print("-" * 50)
             for question, answer in list(answers.items())[:5]:
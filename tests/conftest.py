@@ -7,6 +7,8 @@ This file configures:
 3. Test collection and reporting settings
 """
 
+import os
+
 import pytest
 
 
@@ -20,6 +22,11 @@ def pytest_configure(config):
         "markers",
         "writes: marks tests that write/modify data in Ashby (use with caution)"
     )
+    # Registered here too so the marker is known when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): keeps tests in the same group on one pytest-xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -27,12 +34,13 @@ def pytest_collection_modifyitems(config, items):
     Automatically skip integration tests unless explicitly requested.
     
     This prevents accidentally running integration tests when running
-    the full test suite.
+    the full test suite. Write tests are also skipped unless ASHBY_WRITE_OK
+    is set, before any of their fixtures make API calls.
     """
     # Check if we're running integration tests explicitly
     markers = config.getoption("-m", default="")
-    
-    # If 'integration' is not in the marker expression and we're not 
+
+    # If 'integration' is not in the marker expression and we're not
     # running all tests explicitly, skip integration tests
     if "integration" not in markers and markers != "":
         skip_integration = pytest.mark.skip(
@@ -42,6 +50,33 @@ def pytest_collection_modifyitems(config, items):
             if "integration" in item.keywords:
                 item.add_marker(skip_integration)
 
+    if not os.getenv("ASHBY_WRITE_OK"):
+        skip_writes = pytest.mark.skip(
+            reason="Write tests modify Ashby data (set ASHBY_WRITE_OK=1 to enable)"
+        )
+        for item in items:
+            if "writes" in item.keywords:
+                item.add_marker(skip_writes)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List data left behind by write tests, so it can be removed by hand."""
+    cleanup = [
+        value
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call"
+        for name, value in report.user_properties
+        if name == "ashby_cleanup"
+    ]
+    if cleanup:
+        terminalreporter.section("Ashby cleanup")
+        for line in cleanup:
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            "To manually remove: go to the candidate in the Ashby UI and remove the tag"
+        )
+
 
 # ---------------------------------------------------------------------------
 # Shared Fixtures
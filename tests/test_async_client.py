@@ -0,0 +1,271 @@
+"""Tests for the async Ashby client."""
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from ashby_sdk import AshbyAPIError, AshbyAsyncClient, AshbyAuthError  # noqa: E402
+from ashby_sdk.models import Application, Job, Source  # noqa: E402
+
+
+def make_client(handler):
+    """Create an async client whose HTTP transports are served by handler."""
+    client = AshbyAsyncClient(api_key="test-key", http2=False)
+    client._http = httpx.AsyncClient(
+        base_url=client.BASE_URL,
+        headers=client._http.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    client._download_http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+class TestAsyncClient:
+    """Tests for AshbyAsyncClient requests and pagination."""
+
+    def test_list_jobs(self):
+        """Jobs should be listed and deserialized."""
+
+        def handler(request):
+            assert request.url.path == "/job.list"
+            assert request.headers["Authorization"].startswith("Basic ")
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "results": [{"id": "job-1", "title": "Engineer", "status": "Open"}],
+                    "moreDataAvailable": False,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.jobs.list()
+
+        jobs = asyncio.run(run())
+        assert len(jobs) == 1
+        assert isinstance(jobs[0], Job)
+        assert jobs[0].title == "Engineer"
+
+    def test_pagination_fetches_all_pages(self):
+        """All pages should be fetched following nextCursor."""
+        cursors = []
+
+        def handler(request):
+            body = json.loads(request.content)
+            cursors.append(body.get("cursor"))
+            if body.get("cursor") is None:
+                return httpx.Response(
+                    200,
+                    json={
+                        "success": True,
+                        "results": [{"id": "src_1", "name": "LinkedIn"}],
+                        "moreDataAvailable": True,
+                        "nextCursor": "cursor_1",
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "results": [{"id": "src_2", "name": "Referral"}],
+                    "moreDataAvailable": False,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.sources.list()
+
+        sources = asyncio.run(run())
+        assert [s.name for s in sources] == ["LinkedIn", "Referral"]
+        assert isinstance(sources[0], Source)
+        assert cursors == [None, "cursor_1"]
+
+    def test_get_applications_with_candidates(self):
+        """Applications should be fetched concurrently and keep input order."""
+
+        def handler(request):
+            body = json.loads(request.content)
+            if request.url.path == "/application.info":
+                app_id = body["applicationId"]
+                return httpx.Response(
+                    200,
+                    json={
+                        "success": True,
+                        "results": {"id": app_id, "candidate": {"id": f"cand-{app_id}"}},
+                    },
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "results": {"id": body["id"], "name": body["id"]},
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_applications_with_candidates(["a1", "a2"])
+
+        apps = asyncio.run(run())
+        assert all(isinstance(a, Application) for a in apps)
+        assert [a.candidate.id for a in apps] == ["cand-a1", "cand-a2"]
+
+    def test_list_applications_for_jobs(self):
+        """Applications should be grouped by the job they were listed for."""
+
+        def handler(request):
+            job_id = json.loads(request.content)["jobId"]
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "results": [{"id": f"app-{job_id}", "jobId": job_id}],
+                    "moreDataAvailable": False,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.list_applications_for_jobs(["j1", "j2"])
+
+        by_job = asyncio.run(run())
+        assert list(by_job) == ["j1", "j2"]
+        assert by_job["j2"][0].id == "app-j2"
+
+    def test_api_error(self):
+        """Unsuccessful responses should raise AshbyAPIError."""
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json={
+                    "success": False,
+                    "errors": ["invalid_request"],
+                    "errorInfo": {"message": "Invalid request"},
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.jobs.get("job-1")
+
+        with pytest.raises(AshbyAPIError, match="Invalid request"):
+            asyncio.run(run())
+
+    def test_auth_error_401(self):
+        """A 401 response should raise AshbyAuthError."""
+
+        async def run():
+            async with make_client(lambda request: httpx.Response(401)) as client:
+                await client.jobs.get("job-1")
+
+        with pytest.raises(AshbyAuthError, match="Invalid or missing API key"):
+            asyncio.run(run())
+
+    def test_rate_limit_is_retried_honoring_retry_after(self, sleeps):
+        """A 429 should be retried after the server's Retry-After delay."""
+        responses = iter(
+            [
+                httpx.Response(429, headers={"Retry-After": "3"}),
+                httpx.Response(200, json={"success": True, "results": {"id": "job-1"}}),
+            ]
+        )
+
+        async def run():
+            async with make_client(lambda request: next(responses)) as client:
+                return await client.jobs.get("job-1")
+
+        job = asyncio.run(run())
+        assert job.id == "job-1"
+        assert sleeps == [3]
+
+    def test_writes_are_not_retried_on_server_errors(self, sleeps):
+        """A write answered with a 500 must not be sent again."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(500)
+
+        async def run():
+            async with make_client(handler) as client:
+                await client._request("candidate.createNote", {"candidateId": "c1"})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert calls == ["/candidate.createNote"]
+        assert sleeps == []
+
+    def test_surveys_for_candidate(self):
+        """Survey submissions should be fetched and parsed like the sync client."""
+
+        def handler(request):
+            assert json.loads(request.content)["candidateId"] == "cand-1"
+            return httpx.Response(
+                200,
+                json={
+                    "success": True,
+                    "results": [
+                        {
+                            "candidateId": "cand-1",
+                            "formDefinition": {
+                                "sections": [
+                                    {"fields": [{"field": {"id": "f1", "title": "Remote?"}}]}
+                                ]
+                            },
+                            "submittedValues": {"f1": True},
+                        }
+                    ],
+                    "moreDataAvailable": False,
+                },
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                submissions = await client.surveys.get_for_candidate("cand-1")
+                return client.surveys.parse_submissions(submissions)
+
+        parsed = asyncio.run(run())
+        assert parsed[0]["answers"] == {"Remote?": "Yes"}
+
+    def test_files_download(self):
+        """Files should be downloaded from their signed URL without API credentials."""
+
+        def handler(request):
+            if request.url.path == "/file.info":
+                return httpx.Response(
+                    200,
+                    json={
+                        "success": True,
+                        "results": {"url": "https://files.example.com/r.pdf"},
+                    },
+                )
+            assert "Authorization" not in request.headers
+            return httpx.Response(
+                200,
+                content=b"%PDF-1.4",
+                headers={"content-disposition": 'attachment; filename="resume.pdf"'},
+            )
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.files.download("handle-1")
+
+        assert asyncio.run(run()) == (b"%PDF-1.4", "resume.pdf")
@@ -1,12 +1,21 @@
 """Tests for the Ashby SDK client."""
 
+import json
+
 import pytest
+import responses
 from unittest.mock import patch, MagicMock
 
-from ashby_sdk import AshbyClient, AshbyAuthError, AshbyAPIError
+from ashby_sdk import AshbyClient, AshbyAuthError, AshbyAPIError, AshbyRateLimitError
 from ashby_sdk.models import Job, Application, Candidate
 
 
+@pytest.fixture(scope="class")
+def client():
+    """One client per test class, for classes that only read from it."""
+    return AshbyClient(api_key="test-key")
+
+
 class TestAshbyClientInit:
     """Tests for client initialization."""
 
@@ -15,26 +24,22 @@ class TestAshbyClientInit:
         client = AshbyClient(api_key="test-key")
         assert client.api_key == "test-key"
 
-    def test_init_without_api_key_raises_error(self):
+    def test_init_without_api_key_raises_error(self, monkeypatch):
         """Test that missing API key raises error."""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(AshbyAuthError):
-                AshbyClient(api_key=None)
+        monkeypatch.delenv("ASHBY_API_KEY", raising=False)
+        with pytest.raises(AshbyAuthError):
+            AshbyClient(api_key=None)
 
-    def test_init_from_env_var(self):
+    def test_init_from_env_var(self, monkeypatch):
         """Test initialization from environment variable."""
-        with patch.dict("os.environ", {"ASHBY_API_KEY": "env-key"}):
-            client = AshbyClient()
-            assert client.api_key == "env-key"
+        monkeypatch.setenv("ASHBY_API_KEY", "env-key")
+        client = AshbyClient()
+        assert client.api_key == "env-key"
 
 
 class TestJobsResource:
     """Tests for the jobs resource."""
 
-    @pytest.fixture
-    def client(self):
-        return AshbyClient(api_key="test-key")
-
     @pytest.fixture
     def mock_response(self):
         return {
@@ -65,6 +70,32 @@ class TestJobsResource:
             call_args = mock.call_args[0]
             assert call_args[1]["status"] == ["Open", "Closed"]
 
+    def test_list_applications_expand_forms(self, client):
+        """expand_forms should request form submissions on every page."""
+        page = {
+            "success": True,
+            "results": [{"id": "app-1", "applicationFormSubmissions": [{"id": "form-1"}]}],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", return_value=page) as mock:
+            apps = client.applications.list(job_id="job-1", expand_forms=True)
+        assert mock.call_args[0][1]["expand"] == ["applicationFormSubmissions"]
+        assert apps[0].form_submissions == [{"id": "form-1"}]
+
+    def test_iter_jobs_fetches_pages_lazily(self, client):
+        """iter() should not send any request until the first item is consumed."""
+        pages = [
+            {"success": True, "results": [{"id": "job-1"}], "moreDataAvailable": True, "nextCursor": "c1"},
+            {"success": True, "results": [{"id": "job-2"}], "moreDataAvailable": False},
+        ]
+        with patch.object(client, "_request", side_effect=pages) as mock:
+            jobs = client.jobs.iter()
+            assert mock.call_count == 0
+            first = next(jobs)
+            assert isinstance(first, Job)
+            assert [first.id] + [j.id for j in jobs] == ["job-1", "job-2"]
+        assert mock.call_count == 2
+
 
 class TestModels:
     """Tests for data models."""
@@ -117,6 +148,15 @@ class TestModels:
         assert len(candidate.links) == 1
         assert len(candidate.tags) == 1
 
+    @pytest.mark.parametrize(
+        "handle_obj",
+        ["abc123", {"id": "file-1", "name": "resume.pdf", "handle": "abc123"}, {"handle": "abc123"}],
+    )
+    def test_resume_handle_from_string_or_object(self, handle_obj):
+        """resumeFileHandle may be a bare handle string or a file object."""
+        candidate = Candidate.from_dict({"id": "cand-1", "resumeFileHandle": handle_obj})
+        assert candidate.resume_handle == "abc123"
+
     def test_application_from_dict(self):
         """Test Application model creation from dict."""
         data = {
@@ -136,6 +176,209 @@ class TestModels:
         assert app.stage_name == "Phone Screen"
         assert app.source.name == "LinkedIn"
 
+    def test_null_nested_lists_decode_as_empty(self):
+        """Null or missing nested collections should decode to fresh empty lists."""
+        candidate = Candidate.from_dict({"id": "cand-1", "tags": None, "links": None})
+        other = Candidate.from_dict({"id": "cand-2"})
+        assert candidate.tags == [] and candidate.links == []
+        assert candidate.tags is not other.tags
+        app = Application.from_dict({"id": "app-1", "candidate": None})
+        assert app.candidate_id == ""
+
+    def test_expanded_form_submissions_stay_raw(self):
+        """Expanded form submissions are kept undecoded for parse_submission."""
+        raw_form = {"formDefinition": {"sections": []}, "submittedValues": {}}
+        app = Application.from_dict({"id": "app-1", "applicationFormSubmissions": [raw_form]})
+        assert app.form_submissions == [raw_form]
+        assert app.form_submissions[0] is raw_form
+        assert app.has_form_data
+
+    def test_form_submission_get_field_value(self):
+        """Field lookups should be case-insensitive and return the first match."""
+        from ashby_sdk.models import ApplicationFormSubmission
+
+        form = ApplicationFormSubmission.from_dict({
+            "id": "form-1",
+            "formSubmissionValue": [
+                {"field": {"title": "Notice Period"}, "value": "2 weeks"},
+                {"field": {"title": "notice period"}, "value": "ignored"},
+            ],
+        })
+        assert form.get_field_value("NOTICE PERIOD") == "2 weeks"
+        assert form.get_field_value("Salary") is None
+
+    def test_lookup_index_stays_out_of_dataclass_fields(self):
+        """The lazily built lookup index should not leak into asdict() or equality."""
+        import pickle
+        from dataclasses import asdict, astuple, fields
+
+        from ashby_sdk.models import ApplicationFormSubmission, Feedback
+
+        form = ApplicationFormSubmission.from_dict({
+            "id": "form-1",
+            "formSubmissionValue": [{"field": {"title": "Notice Period"}, "value": "2 weeks"}],
+        })
+        feedback = Feedback.from_dict({
+            "id": "fb-1",
+            "submittedValues": [{"field": {"title": "Culture"}, "value": 3}],
+        })
+        assert form.get_field_value("notice period") == "2 weeks"
+        assert feedback.get_score("culture") == 3
+
+        for model in (form, feedback):
+            assert not any(name.startswith("_") for name in asdict(model))
+            assert len(astuple(model)) == len(fields(model))
+            assert pickle.loads(pickle.dumps(model)) == model
+        assert form == ApplicationFormSubmission.from_dict(form.raw_data)
+
+    def test_lookup_index_follows_edits_to_the_entries(self):
+        """Appending, replacing the list or editing values should not leave lookups stale."""
+        from ashby_sdk.models import ApplicationFormSubmission, Feedback, FormFieldSubmission
+
+        form = ApplicationFormSubmission.from_dict({
+            "id": "form-1",
+            "formSubmissionValue": [{"field": {"title": "Notice Period"}, "value": "2 weeks"}],
+        })
+        feedback = Feedback.from_dict({
+            "id": "fb-1",
+            "submittedValues": [{"field": {"title": "Culture"}, "value": 3}],
+        })
+        assert form.get_field_value("Salary") is None
+        assert feedback.get_score("Coding") is None
+
+        form.fields.append(FormFieldSubmission("f2", "Salary", "String", "100k"))
+        form.fields[0].value = "1 month"
+        feedback.submitted_values.append({"field": {"title": "Coding"}, "value": 4})
+        assert form.get_field_value("salary") == "100k"
+        assert form.get_field_value("notice period") == "1 month"
+        assert feedback.get_score("coding") == 4
+
+        feedback.submitted_values = [{"field": {"title": "Culture"}, "value": 1}]
+        assert feedback.get_score("culture") == 1
+        assert feedback.get_score("coding") is None
+
+    def test_job_posting_description_strips_html(self):
+        """Without plain text, the description should fall back to tag-stripped HTML."""
+        from ashby_sdk.models import JobPosting
+
+        posting = JobPosting.from_dict({"descriptionHtml": "<p>Build <b>things</b></p>"})
+        assert posting.description == " Build  things  "
+
+    def test_set_keep_raw(self):
+        """raw_data should only be filled while raw retention is enabled."""
+        from ashby_sdk import models
+
+        data = {"id": "job-1", "title": "Engineer"}
+        assert Job.from_dict(data).raw_data is data
+        models.set_keep_raw(False)
+        try:
+            assert Job.from_dict(data).raw_data == {}
+        finally:
+            models.set_keep_raw(True)
+
+    def test_keep_raw_context_restores_setting(self):
+        """keep_raw() should only apply inside its block."""
+        from ashby_sdk import models
+
+        data = {"id": "job-1"}
+        with models.keep_raw(False):
+            assert Job.from_dict(data).raw_data == {}
+        assert Job.from_dict(data).raw_data is data
+
+    def test_keep_raw_is_scoped_to_the_caller(self):
+        """keep_raw() should not leak into other threads, but reach SDK worker threads."""
+        import threading
+
+        from ashby_sdk import models
+
+        data = {"id": "job-1"}
+        seen = []
+        with models.keep_raw(False):
+            thread = threading.Thread(target=lambda: seen.append(Job.from_dict(data).raw_data))
+            thread.start()
+            thread.join()
+            with patch.object(
+                AshbyClient, "_request", return_value={"success": True, "results": data}
+            ):
+                apps = AshbyClient(api_key="test-key").get_applications_with_candidates(["a1"])
+        assert seen[0] is data
+        assert apps[0].raw_data == {}
+
+    def test_keep_raw_follows_each_call_on_a_shared_client(self):
+        """Each get_applications_with_candidates() call should use its own caller's context."""
+        from ashby_sdk import models
+
+        data = {"id": "app-1"}
+        client = AshbyClient(api_key="test-key")
+        with patch.object(
+            AshbyClient, "_request", return_value={"success": True, "results": data}
+        ):
+            with models.keep_raw(True):
+                kept = client.get_applications_with_candidates(["a1"])
+            with models.keep_raw(False):
+                dropped = client.get_applications_with_candidates(["a1"])
+        assert kept[0].raw_data is data
+        assert dropped[0].raw_data == {}
+
+    def test_flat_model_fast_and_fallback_paths_agree(self):
+        """Complete and partial records should decode the same fields."""
+        from ashby_sdk.models import User
+
+        full = {
+            "id": "u1", "firstName": "Ada", "lastName": "Lovelace",
+            "email": "ada@example.com", "globalRole": "Admin", "isEnabled": True,
+        }
+        partial = {k: v for k, v in full.items() if k != "isEnabled"}
+        assert User.from_dict(full) == User(
+            id="u1", first_name="Ada", last_name="Lovelace",
+            email="ada@example.com", global_role="Admin", is_enabled=True,
+        )
+        assert User.from_dict(partial) == User(
+            id="u1", first_name="Ada", last_name="Lovelace",
+            email="ada@example.com", global_role="Admin", is_enabled=None,
+        )
+
+    def test_models_are_slotted(self):
+        """Model instances should not carry a per-instance __dict__."""
+        job = Job.from_dict({"id": "job-1"})
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.unknown_attribute = 1
+
+    def test_enum_like_fields_are_interned(self):
+        """Repeated status values should share a single string object."""
+        status = "".join(["Ac", "tive"])
+        first = Application.from_dict({"id": "a1", "status": status})
+        second = Application.from_dict({"id": "a2", "status": "".join(["Act", "ive"])})
+        assert first.status is second.status
+
+    def test_slotted_models_pickle(self):
+        """Slotted models should survive a pickle round trip (e.g. to worker processes)."""
+        import pickle
+
+        app = Application.from_dict({
+            "id": "app-1",
+            "candidate": {"id": "cand-1", "name": "Jane"},
+            "currentInterviewStage": {"id": "stage-1", "name": "Onsite"},
+        })
+        assert pickle.loads(pickle.dumps(app)) == app
+
+
+class TestExceptions:
+    """Tests for SDK exception types."""
+
+    def test_exceptions_pickle_with_extra_fields(self):
+        """Extra exception fields should survive a pickle round trip."""
+        import pickle
+
+        api_error = pickle.loads(pickle.dumps(AshbyAPIError("bad request", ["invalid_input"])))
+        assert str(api_error) == "bad request"
+        assert api_error.errors == ["invalid_input"]
+
+        rate_error = pickle.loads(pickle.dumps(AshbyRateLimitError("slow down", retry_after="30")))
+        assert str(rate_error) == "slow down"
+        assert rate_error.retry_after == "30"
+
 
 class TestSurveysParsing:
     """Tests for survey/form submission parsing."""
@@ -192,15 +435,214 @@ class TestSurveysParsing:
         parsed = client.surveys.parse_submission(survey)
         assert parsed["answers"]["Remote OK?"] == "Yes"
 
+    def test_parse_submission_formats_option_values(self, client):
+        """Option dicts and multi-select lists should be flattened to text."""
+        survey = {
+            "submittedValues": {
+                "single": {"name": "Berlin"},
+                "text": {"text": "Hello", "name": "ignored"},
+                "multi": [{"name": "Python"}, "Go"],
+                "other": {"value": 3},
+            },
+        }
 
-class TestJobPostingsGetForJob:
-    """Tests for job posting selection when multiple postings exist."""
+        answers = client.surveys.parse_submission(survey)["answers"]
+        assert answers == {
+            "single": "Berlin",
+            "text": "Hello",
+            "multi": "Python, Go",
+            "other": {"value": 3},
+        }
+
+    def test_parse_submissions_reuses_field_map(self, client):
+        """Submissions sharing a form definition should share one field map build."""
+        from ashby_sdk.resources import surveys
+
+        form_def = {
+            "id": "form-1",
+            "sections": [
+                {"fields": [{"field": {"id": "f1", "title": "Start date?", "path": "f1"}}]}
+            ],
+        }
+
+        def make_survey(answer):
+            return {
+                "formDefinition": form_def,
+                "submittedValues": {"f1": answer, "_systemfield_name": "Jane"},
+            }
+
+        with patch.object(
+            surveys, "_build_field_map", wraps=surveys._build_field_map
+        ) as build:
+            parsed = client.surveys.parse_submissions(
+                [make_survey("June"), make_survey("July")]
+            )
+
+        assert [p["answers"] for p in parsed] == [
+            {"Start date?": "June"},
+            {"Start date?": "July"},
+        ]
+        assert build.call_count == 1
+
+    def test_parse_submission_uses_edited_form_labels(self, client):
+        """An edited form definition should be parsed with its new field titles."""
+        def make_form(title):
+            return {
+                "id": "form-1",
+                "sections": [{"fields": [{"field": {"id": "f1", "title": title, "path": "f1"}}]}],
+            }
+
+        before = client.surveys.parse_submission(
+            {"formDefinition": make_form("Start date?"), "submittedValues": {"f1": "June"}}
+        )
+        after = client.surveys.parse_submission(
+            {"formDefinition": make_form("Earliest start?"), "submittedValues": {"f1": "June"}}
+        )
+        assert before["answers"] == {"Start date?": "June"}
+        assert after["answers"] == {"Earliest start?": "June"}
+
+    def test_parse_submission_with_null_fields(self, client):
+        """Null form definitions and values should parse as empty."""
+        parsed = client.surveys.parse_submission(
+            {"id": "sub-1", "formDefinition": None, "submittedValues": None}
+        )
+        assert parsed["form_id"] == "sub-1"
+        assert parsed["answers"] == {}
+
+    def test_make_submission_parser(self, client):
+        """A bound parser should map answers using its form definition."""
+        form_def = {
+            "sections": [
+                {"fields": [{"field": {"id": "f1", "title": "Remote OK?", "path": "f1"}}]}
+            ]
+        }
+        parse = client.surveys.make_submission_parser(form_def)
+        parsed = parse({"candidateId": "cand-1", "submittedValues": {"f1": False}})
+        assert parsed["candidate_id"] == "cand-1"
+        assert parsed["answers"] == {"Remote OK?": "No"}
+
+
+class TestSurveysForCandidate:
+    """Tests for looking up survey submissions by candidate."""
 
     @pytest.fixture
     def client(self):
         return AshbyClient(api_key="test-key")
 
-    def _make_posting_dict(self, posting_id, title, job_id, updated_at):
+    def test_get_for_candidate_indexes_once(self, client):
+        """With cached=True, candidate lookups should share one download of the survey list."""
+        list_resp = {
+            "success": True,
+            "results": [
+                {"id": "s1", "candidateId": "cand-1"},
+                {"id": "s2", "candidateId": "cand-2"},
+                {"id": "s3", "candidateId": "cand-1"},
+            ],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", return_value=list_resp) as mock:
+            first = client.surveys.get_for_candidate("cand-1", cached=True)
+            second = client.surveys.get_for_candidate("cand-2", cached=True)
+            missing = client.surveys.get_for_candidate("cand-3", cached=True)
+
+        assert [s["id"] for s in first] == ["s1", "s3"]
+        assert [s["id"] for s in second] == ["s2"]
+        assert missing == []
+        # One filtered probe (ignored by the server), then one indexed listing
+        assert mock.call_count == 2
+
+    def test_get_for_candidate_sees_new_submissions_when_not_cached(self, client):
+        """Without cached=True, each lookup should re-read the survey list."""
+        rejected = AshbyAPIError("API error: unknown field", errors=["invalid_input"])
+        before = {
+            "success": True,
+            "results": [{"id": "s1", "candidateId": "cand-1"}],
+            "moreDataAvailable": False,
+        }
+        after = {
+            "success": True,
+            "results": [
+                {"id": "s1", "candidateId": "cand-1"},
+                {"id": "s2", "candidateId": "cand-1"},
+            ],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", side_effect=[rejected, before, after]):
+            first = client.surveys.get_for_candidate("cand-1")
+            second = client.surveys.get_for_candidate("cand-1")
+
+        assert [s["id"] for s in first] == ["s1"]
+        assert [s["id"] for s in second] == ["s1", "s2"]
+
+    def test_get_for_candidate_cached_results_are_copies(self, client):
+        """Mutating a cached lookup's submissions should not affect later lookups."""
+        rejected = AshbyAPIError("API error: unknown field", errors=["invalid_input"])
+        list_resp = {
+            "success": True,
+            "results": [{"id": "s1", "candidateId": "cand-1", "submittedValues": {}}],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", side_effect=[rejected, list_resp]):
+            first = client.surveys.get_for_candidate("cand-1", cached=True)
+            first[0]["submittedValues"]["f1"] = "edited"
+            second = client.surveys.get_for_candidate("cand-1", cached=True)
+
+        assert second[0]["submittedValues"] == {}
+
+    def test_submissions_without_candidate_group_under_none(self):
+        """Sync and async surveys should index candidate-less submissions the same way."""
+        from ashby_sdk.resources import AsyncSurveysResource, SurveysResource
+
+        submissions = [{"id": "s1", "candidateId": "cand-1"}, {"id": "s2"}]
+        for resource_class in (SurveysResource, AsyncSurveysResource):
+            index = resource_class(MagicMock())._group_by_candidate(submissions)
+            assert index == {"cand-1": [submissions[0]], None: [submissions[1]]}
+
+    def test_get_for_candidate_uses_server_side_filter(self, client):
+        """When the API honors candidateId, only that candidate's data is fetched."""
+        filtered_resp = {
+            "success": True,
+            "results": [{"id": "s1", "candidateId": "cand-1"}],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", return_value=filtered_resp) as mock:
+            result = client.surveys.get_for_candidate("cand-1")
+
+        assert [s["id"] for s in result] == ["s1"]
+        assert mock.call_count == 1
+        assert mock.call_args[0][1]["candidateId"] == "cand-1"
+
+    def test_get_for_candidate_falls_back_when_filter_rejected(self, client):
+        """A rejected candidateId parameter should switch to the candidate index."""
+        list_resp = {
+            "success": True,
+            "results": [{"id": "s1", "candidateId": "cand-1"}],
+            "moreDataAvailable": False,
+        }
+        rejected = AshbyAPIError("API error: unknown field", errors=["invalid_input"])
+        with patch.object(client, "_request", side_effect=[rejected, list_resp]) as mock:
+            result = client.surveys.get_for_candidate("cand-1")
+
+        assert [s["id"] for s in result] == ["s1"]
+        assert "candidateId" not in mock.call_args[0][1]
+        assert client.surveys._candidate_filter_supported is False
+
+    def test_get_for_candidate_reraises_other_errors(self, client):
+        """Unrelated API errors should propagate and not disable the filter."""
+        failure = AshbyAPIError("API error: boom", errors=["internal_error"])
+        with patch.object(client, "_request", side_effect=failure), pytest.raises(
+            AshbyAPIError, match="boom"
+        ):
+            client.surveys.get_for_candidate("cand-1")
+
+        assert client.surveys._candidate_filter_supported is None
+
+
+class TestJobPostingsGetForJob:
+    """Tests for job posting selection when multiple postings exist."""
+
+    @staticmethod
+    def _make_posting_dict(posting_id, title, job_id, updated_at):
         return {
             "id": posting_id,
             "title": title,
@@ -212,7 +654,8 @@ class TestJobPostingsGetForJob:
             "updatedAt": updated_at,
         }
 
-    def _make_full_posting_dict(self, posting_id, title, job_id, description):
+    @staticmethod
+    def _make_full_posting_dict(posting_id, title, job_id, description):
         return {
             "id": posting_id,
             "title": title,
@@ -302,7 +745,16 @@ class TestJobPostingsGetForJob:
 
     def test_get_description_resolves_title_automatically(self, client):
         """get_description should look up the job title and match the right posting."""
-        # 1st call: job.info -> returns job with title "Key Account Manager"
+        # 1st call: jobPosting.list -> returns two postings
+        list_resp = {
+            "success": True,
+            "results": [
+                self._make_posting_dict("p-wrong", "Customer Success Manager", "job-1", "2026-01-01T00:00:00Z"),
+                self._make_posting_dict("p-right", "Key Account Manager", "job-1", "2026-01-02T00:00:00Z"),
+            ],
+            "moreDataAvailable": False,
+        }
+        # 2nd call: job.info -> returns job with title "Key Account Manager"
         job_info_resp = {
             "success": True,
             "results": {
@@ -311,23 +763,112 @@ class TestJobPostingsGetForJob:
                 "status": "Open",
             },
         }
-        # 2nd call: jobPosting.list -> returns two postings
+        # 3rd call: jobPosting.info -> returns the matched posting with description
+        get_resp = {
+            "success": True,
+            "results": self._make_full_posting_dict("p-right", "Key Account Manager", "job-1", "The KAM JD"),
+        }
+        with patch.object(client, "_request", side_effect=[list_resp, job_info_resp, get_resp]):
+            description = client.job_postings.get_description("job-1")
+            assert description == "The KAM JD"
+
+    def test_get_description_single_posting_skips_job_lookup(self, client):
+        """With one posting, no job.info lookup should be needed to pick it."""
         list_resp = {
             "success": True,
             "results": [
-                self._make_posting_dict("p-wrong", "Customer Success Manager", "job-1", "2026-01-01T00:00:00Z"),
-                self._make_posting_dict("p-right", "Key Account Manager", "job-1", "2026-01-02T00:00:00Z"),
+                self._make_posting_dict("p1", "Engineer", "job-1", "2026-01-01T00:00:00Z"),
             ],
             "moreDataAvailable": False,
         }
-        # 3rd call: jobPosting.info -> returns the matched posting with description
         get_resp = {
             "success": True,
-            "results": self._make_full_posting_dict("p-right", "Key Account Manager", "job-1", "The KAM JD"),
+            "results": self._make_full_posting_dict("p1", "Engineer", "job-1", "desc"),
         }
-        with patch.object(client, "_request", side_effect=[job_info_resp, list_resp, get_resp]):
-            description = client.job_postings.get_description("job-1")
-            assert description == "The KAM JD"
+        with patch.object(client, "_request", side_effect=[list_resp, get_resp]) as mock:
+            assert client.job_postings.get_description("job-1") == "desc"
+        assert [c[0][0] for c in mock.call_args_list] == ["jobPosting.list", "jobPosting.info"]
+
+    def test_listed_description_skips_info_call(self, client):
+        """A posting listed with its description should not be fetched again."""
+        list_resp = {
+            "success": True,
+            "results": [
+                self._make_full_posting_dict("p1", "Engineer", "job-1", "listed desc"),
+            ],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", return_value=list_resp) as mock:
+            posting = client.job_postings.get_for_job("job-1")
+        assert posting.description == "listed desc"
+        assert mock.call_count == 1
+
+    def test_listed_html_only_description_fetches_details(self, client):
+        """A posting listed with only HTML should still be fetched for its plain text."""
+        listed = self._make_posting_dict("p1", "Engineer", "job-1", "2026-01-01T00:00:00Z")
+        listed["descriptionHtml"] = "<p>Build</p>"
+        list_resp = {"success": True, "results": [listed], "moreDataAvailable": False}
+        get_resp = {
+            "success": True,
+            "results": self._make_full_posting_dict("p1", "Engineer", "job-1", "Build"),
+        }
+        with patch.object(client, "_request", side_effect=[list_resp, get_resp]) as mock:
+            posting = client.job_postings.get_for_job("job-1")
+        assert posting.description_plain == "Build"
+        assert mock.call_count == 2
+
+    def test_get_descriptions_lists_postings_once(self, client):
+        """Descriptions for several jobs should share one jobPosting.list."""
+        list_resp = {
+            "success": True,
+            "results": [
+                self._make_full_posting_dict("p1", "Engineer", "job-1", "Build"),
+                self._make_full_posting_dict("p2", "Sales", "job-2", "Sell"),
+                self._make_full_posting_dict("p3", "Other", "job-3", "Other"),
+            ],
+            "moreDataAvailable": False,
+        }
+        with patch.object(client, "_request", return_value=list_resp) as mock:
+            descriptions = client.job_postings.get_descriptions(["job-2", "job-1", "job-9"])
+        assert descriptions == {"job-2": "Sell", "job-1": "Build", "job-9": None}
+        assert mock.call_count == 1
+
+    def test_get_descriptions_caps_workers_at_pool_size(self, client):
+        """More workers than pooled connections should never be started."""
+        from ashby_sdk.resources import job_postings
+
+        list_resp = {"success": True, "results": [], "moreDataAvailable": False}
+        job_ids = [f"job-{i}" for i in range(40)]
+        with patch.object(client, "_request", return_value=list_resp), patch.object(
+            job_postings, "ThreadPoolExecutor", wraps=job_postings.ThreadPoolExecutor
+        ) as executor:
+            descriptions = client.job_postings.get_descriptions(job_ids, max_workers=64)
+        assert executor.call_args.kwargs["max_workers"] == 32
+        assert descriptions == dict.fromkeys(job_ids)
+
+    def test_list_filters_by_job_across_pages(self, client):
+        """Postings for other jobs should be dropped on every page."""
+        pages = [
+            {
+                "success": True,
+                "results": [
+                    self._make_posting_dict("p1", "Engineer", "job-1", "2026-01-01T00:00:00Z"),
+                    self._make_posting_dict("p2", "Designer", "job-2", "2026-01-01T00:00:00Z"),
+                ],
+                "moreDataAvailable": True,
+                "nextCursor": "c1",
+            },
+            {
+                "success": True,
+                "results": [
+                    self._make_posting_dict("p3", "Engineer II", "job-1", "2026-01-02T00:00:00Z"),
+                ],
+                "moreDataAvailable": False,
+            },
+        ]
+        with patch.object(client, "_request", side_effect=pages):
+            postings = client.job_postings.list(job_id="job-1")
+        assert [p.id for p in postings] == ["p1", "p3"]
 
     def test_no_postings_returns_none(self, client):
         """With no postings, None should be returned."""
@@ -339,3 +880,336 @@ class TestJobPostingsGetForJob:
         with patch.object(client, "_request", return_value=list_resp):
             posting = client.job_postings.get_for_job("job-1")
             assert posting is None
+
+
+class TestClientSession:
+    """Tests for the persistent HTTP session."""
+
+    def test_session_carries_auth_headers(self):
+        """Auth headers should be set once on the session."""
+        client = AshbyClient(api_key="test-key")
+        assert client._session.headers["Authorization"].startswith("Basic ")
+        assert client._session.headers["Accept"] == "application/json"
+
+    def test_auth_header_is_memoized(self):
+        """Clients sharing an API key should reuse the encoded auth header."""
+        from ashby_sdk.client import _auth_header
+
+        _auth_header.cache_clear()
+        AshbyClient(api_key="test-key")
+        AshbyClient(api_key="test-key")
+        info = _auth_header.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_session_requests_compressed_responses(self):
+        """Large list pages should be transferred compressed."""
+        client = AshbyClient(api_key="test-key")
+        assert "gzip" in client._session.headers["Accept-Encoding"]
+
+    def test_writes_are_not_retried_on_server_errors(self):
+        """Mutating endpoints should only retry statuses the server rejected outright."""
+        client = AshbyClient(api_key="test-key")
+        read_retry = client._session.get_adapter("https://api.ashbyhq.com/job.list").max_retries
+        write_retry = client._session.get_adapter(
+            "https://api.ashbyhq.com/candidate.createNote"
+        ).max_retries
+        assert 500 in read_retry.status_forcelist
+        assert set(write_retry.status_forcelist) == {429, 503}
+        assert write_retry.read == 0
+
+    def test_orjson_is_preferred_when_installed(self):
+        """Responses should be decoded with orjson whenever it is importable."""
+        orjson = pytest.importorskip("orjson")
+        assert AshbyClient._json_loads is orjson.loads
+
+    @responses.activate
+    def test_json_decoder_can_be_overridden(self):
+        """Responses should be decoded from raw bytes by the configured decoder."""
+        responses.post(
+            "https://api.ashbyhq.com/job.info",
+            json={"success": True, "results": {"id": "job-1"}},
+        )
+        client = AshbyClient(api_key="test-key")
+        seen = []
+
+        def loads(raw):
+            seen.append(raw)
+            return json.loads(raw)
+
+        client._json_loads = loads
+        job = client.jobs.get("job-1")
+        assert job.id == "job-1"
+        assert isinstance(seen[0], bytes)
+
+    @responses.activate
+    def test_request_body_is_json_encoded(self):
+        """Request bodies should be sent as JSON with the right content type."""
+        responses.post(
+            "https://api.ashbyhq.com/job.info",
+            json={"success": True, "results": {"id": "job-1"}},
+        )
+        client = AshbyClient(api_key="test-key")
+
+        client.jobs.get("job-1")
+
+        request = responses.calls[0].request
+        assert json.loads(request.body) == {"id": "job-1"}
+        assert request.headers["Content-Type"] == "application/json"
+
+    def test_context_manager_closes_session(self):
+        """Exiting the context manager should close the session."""
+        client = AshbyClient(api_key="test-key")
+        with patch.object(client._session, "close") as mock_close:
+            with client as entered:
+                assert entered is client
+            mock_close.assert_called_once()
+
+    def test_close_releases_download_session_and_executor(self):
+        """close() should release every pooled resource, and be safe to repeat."""
+        client = AshbyClient(api_key="test-key")
+        executor = client._get_executor()
+        with patch.object(client._download_session, "close") as mock_close:
+            client.close()
+            client.close()
+        assert mock_close.call_count == 2
+        assert client._executor is None
+        assert executor._shutdown
+
+
+class TestPaginationPrefetch:
+    """Tests for background prefetching of the next page."""
+
+    @pytest.fixture
+    def client(self):
+        return AshbyClient(api_key="test-key")
+
+    @pytest.fixture
+    def pages(self):
+        return [
+            {"success": True, "results": [{"id": "1"}], "moreDataAvailable": True, "nextCursor": "c1"},
+            {"success": True, "results": [{"id": "2"}], "moreDataAvailable": True, "nextCursor": "c2"},
+            {"success": True, "results": [{"id": "3"}], "moreDataAvailable": False},
+        ]
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_paginate_yields_all_pages_in_order(self, client, pages, prefetch):
+        """Results should be identical with and without prefetching."""
+        sent = []
+
+        def fake_request(endpoint, data=None):
+            sent.append(dict(data))
+            return pages[len(sent) - 1]
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            items = list(client._paginate("job.list", {"status": ["Open"]}, prefetch=prefetch))
+        assert [i["id"] for i in items] == ["1", "2", "3"]
+        assert [d.get("cursor") for d in sent] == [None, "c1", "c2"]
+        assert all(d["status"] == ["Open"] for d in sent)
+
+    def test_paginate_pages_yields_one_list_per_page(self, client, pages):
+        """_paginate_pages should yield whole pages rather than items."""
+        with patch.object(client, "_request", side_effect=pages):
+            result = list(client._paginate_pages("job.list"))
+        assert result == [[{"id": "1"}], [{"id": "2"}], [{"id": "3"}]]
+
+    def test_paginate_stops_without_cursor(self, client):
+        """moreDataAvailable without a nextCursor should end pagination."""
+        page = {"success": True, "results": [{"id": "1"}], "moreDataAvailable": True}
+        with patch.object(client, "_request", return_value=page) as mock:
+            items = list(client._paginate("job.list"))
+        assert items == [{"id": "1"}]
+        assert mock.call_count == 1
+
+    def test_paginate_raises_on_repeated_cursor(self, client):
+        """A cursor the server already returned should not be requested again."""
+        page = {"success": True, "results": [], "moreDataAvailable": True, "nextCursor": "c1"}
+        with patch.object(client, "_request", return_value=page), pytest.raises(
+            AshbyAPIError, match="duplicate pagination cursor"
+        ):
+            list(client._paginate("job.list"))
+
+    def test_paginate_does_not_mutate_caller_data(self, client, pages):
+        """The caller's filter dict should be left untouched."""
+        data = {"status": ["Open"]}
+        with patch.object(client, "_request", side_effect=pages):
+            list(client._paginate("job.list", data))
+        assert data == {"status": ["Open"]}
+
+
+class TestConcurrentFanOut:
+    """Tests for concurrent convenience methods."""
+
+    @pytest.fixture
+    def client(self):
+        return AshbyClient(api_key="test-key")
+
+    def test_get_applications_with_candidates_preserves_order(self, client):
+        """Applications should come back in input order with candidates attached."""
+        def fake_request(endpoint, data=None):
+            if endpoint == "application.info":
+                app_id = data["applicationId"]
+                return {
+                    "success": True,
+                    "results": {"id": app_id, "candidate": {"id": f"cand-{app_id}"}},
+                }
+            return {"success": True, "results": {"id": data["id"], "name": data["id"]}}
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            apps = client.get_applications_with_candidates(["a1", "a2", "a3"])
+
+        assert [a.id for a in apps] == ["a1", "a2", "a3"]
+        assert [a.candidate.id for a in apps] == ["cand-a1", "cand-a2", "cand-a3"]
+
+
+class TestFilesDownload:
+    """Tests for file downloads."""
+
+    @responses.activate
+    def test_download_does_not_send_api_credentials(self):
+        """Downloads should use the signed URL without the Ashby auth header."""
+        responses.post(
+            "https://api.ashbyhq.com/file.info",
+            json={"success": True, "results": {"url": "https://files.example.com/r.pdf?sig=1"}},
+        )
+        responses.get(
+            "https://files.example.com/r.pdf",
+            body=b"%PDF-1.4",
+            headers={"content-disposition": 'attachment; filename="resume.pdf"'},
+        )
+        client = AshbyClient(api_key="test-key")
+
+        content, filename = client.files.download("handle-1")
+
+        assert content == b"%PDF-1.4"
+        assert filename == "resume.pdf"
+        assert "Authorization" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_download_to_file_streams_to_disk(self, tmp_path):
+        """download_to_file should write the body to the given path."""
+        responses.post(
+            "https://api.ashbyhq.com/file.info",
+            json={"success": True, "results": {"url": "https://files.example.com/r.pdf"}},
+        )
+        responses.get(
+            "https://files.example.com/r.pdf",
+            body=b"x" * 200_000,
+            headers={"content-disposition": 'attachment; filename="resume.pdf"'},
+        )
+        client = AshbyClient(api_key="test-key")
+        path = tmp_path / "out.pdf"
+
+        filename = client.files.download_to_file("handle-1", path)
+
+        assert filename == "resume.pdf"
+        assert path.read_bytes() == b"x" * 200_000
+
+    @responses.activate
+    def test_download_to_file_uses_default_permissions(self, tmp_path):
+        """The downloaded file should get umask-based permissions, not 0600."""
+        import os
+        import stat
+
+        responses.post(
+            "https://api.ashbyhq.com/file.info",
+            json={"success": True, "results": {"url": "https://files.example.com/r.pdf"}},
+        )
+        responses.get("https://files.example.com/r.pdf", body=b"pdf")
+        client = AshbyClient(api_key="test-key")
+        path = tmp_path / "out.pdf"
+
+        umask = os.umask(0o022)
+        try:
+            client.files.download_to_file("handle-1", path)
+        finally:
+            os.umask(umask)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    @responses.activate
+    def test_download_to_file_leaves_nothing_on_failure(self, tmp_path):
+        """A failed download should leave neither a partial file nor a temp file."""
+        import requests
+
+        responses.post(
+            "https://api.ashbyhq.com/file.info",
+            json={"success": True, "results": {"url": "https://files.example.com/r.pdf"}},
+        )
+        responses.get("https://files.example.com/r.pdf", status=500)
+        client = AshbyClient(api_key="test-key")
+
+        with pytest.raises(requests.HTTPError):
+            client.files.download_to_file("handle-1", tmp_path / "out.pdf")
+
+        assert list(tmp_path.iterdir()) == []
+
+    @responses.activate
+    def test_download_into_stream_with_custom_chunk_size(self):
+        """Content should be written to dest in chunks, not returned."""
+        import io
+
+        responses.post(
+            "https://api.ashbyhq.com/file.info",
+            json={"success": True, "results": {"url": "https://files.example.com/r.pdf"}},
+        )
+        responses.get("https://files.example.com/r.pdf", body=b"abcdefghij")
+        client = AshbyClient(api_key="test-key")
+        dest = MagicMock(wraps=io.BytesIO())
+
+        content, filename = client.files.download("handle-1", dest=dest, chunk_size=4)
+
+        assert content == b""
+        assert filename == "downloaded_file"
+        assert [c.args[0] for c in dest.write.call_args_list] == [b"abcd", b"efgh", b"ij"]
+
+    @responses.activate
+    def test_download_many_preserves_order(self):
+        """download_many should return results in input order."""
+        def file_info(request):
+            handle = json.loads(request.body)["fileHandle"]
+            url = f"https://files.example.com/{handle}.pdf"
+            return 200, {}, json.dumps({"success": True, "results": {"url": url}})
+
+        responses.add_callback(
+            responses.POST, "https://api.ashbyhq.com/file.info", callback=file_info
+        )
+        for handle in ("h1", "h2", "h3"):
+            responses.get(
+                f"https://files.example.com/{handle}.pdf",
+                body=handle.encode(),
+                headers={"content-disposition": f'attachment; filename="{handle}.pdf"'},
+            )
+        client = AshbyClient(api_key="test-key")
+
+        results = client.files.download_many(["h3", "h1", "h2"])
+
+        assert results == [(b"h3", "h3.pdf"), (b"h1", "h1.pdf"), (b"h2", "h2.pdf")]
+
+    def test_download_many_caps_workers_at_pool_size(self):
+        """More download threads than pooled connections should never be started."""
+        from ashby_sdk.resources import files
+
+        client = AshbyClient(api_key="test-key")
+        handles = [f"h{i}" for i in range(40)]
+        with patch.object(client.files, "download", side_effect=lambda h: (b"", h)), patch.object(
+            files, "ThreadPoolExecutor", wraps=files.ThreadPoolExecutor
+        ) as executor:
+            results = client.files.download_many(handles, max_workers=64)
+        assert executor.call_args.kwargs["max_workers"] == 32
+        assert [name for _, name in results] == handles
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ('attachment; filename="my resume.pdf"', "my resume.pdf"),
+            ("attachment; filename*=UTF-8''J%C3%BCrgen%20CV.pdf", "Jürgen CV.pdf"),
+            ('attachment; filename="cv.pdf"; size=123', "cv.pdf"),
+            ("inline", None),
+            ("", None),
+        ],
+    )
+    def test_filename_from_content_disposition(self, header, expected):
+        """Filenames should be parsed per RFC 6266 / RFC 5987."""
+        from ashby_sdk.resources.files import _filename_from_disposition
+
+        assert _filename_from_disposition(header) == expected
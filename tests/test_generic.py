@@ -7,6 +7,8 @@ allowing us to test the SDK without making real API calls.
 Run with: pytest tests/test_generic.py
 """
 
+import json
+
 import pytest
 import responses
 
@@ -41,6 +43,28 @@ def mock_client():
     return AshbyClient(api_key="test_api_key_12345")
 
 
+# ---------------------------------------------------------------------------
+# Generic Resource Registry Tests
+# ---------------------------------------------------------------------------
+
+
+class TestGenericResourceRegistry:
+    """Tests for lazy creation of generic resources."""
+
+    def test_resource_created_once_per_client(self, mock_client):
+        """Repeated access should return the same cached resource."""
+        assert "sources" not in vars(mock_client)
+        sources = mock_client.sources
+        assert sources is mock_client.sources
+        assert sources.endpoint == "source"
+        assert sources.model is Source
+
+    def test_unknown_attribute_raises(self, mock_client):
+        """Names outside the registry should still raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute 'nonexistent'"):
+            assert mock_client.nonexistent
+
+
 # ---------------------------------------------------------------------------
 # Generic Resource Tests - List Only Endpoints
 # ---------------------------------------------------------------------------
@@ -65,7 +89,7 @@ class TestSourcesResource:
         )
 
         sources = mock_client.sources.list()
-        
+
         assert len(sources) == 2
         assert isinstance(sources[0], Source)
         assert sources[0].id == "src_1"
@@ -98,12 +122,26 @@ class TestArchiveReasonsResource:
         )
 
         reasons = mock_client.archive_reasons.list()
-        
+
         assert len(reasons) == 2
         assert isinstance(reasons[0], ArchiveReason)
         assert reasons[0].name == "Not qualified"
         assert reasons[1].reason_type == "Withdrawal"
 
+    @pytest.mark.parametrize(
+        "model, data, expected",
+        [
+            (ArchiveReason, {"text": "Withdrew", "name": "ignored"}, "Withdrew"),
+            (ArchiveReason, {"name": "Withdrew"}, "Withdrew"),
+            (CloseReason, {"text": "", "name": "Filled"}, "Filled"),
+            (Project, {"title": "Talent Pool"}, "Talent Pool"),
+            (HiringTeamRole, {"id": "r1"}, ""),
+        ],
+    )
+    def test_name_falls_back_to_alternate_key(self, model, data, expected):
+        """Models should take their name from the first non-empty alternate key."""
+        assert model.from_dict(data).name == expected
+
 
 class TestCandidateTagsResource:
     """Tests for the candidate_tags resource."""
@@ -124,7 +162,7 @@ class TestCandidateTagsResource:
         )
 
         tags = mock_client.candidate_tags.list()
-        
+
         assert len(tags) == 2
         assert isinstance(tags[0], Tag)
         assert tags[0].title == "VIP"
@@ -154,7 +192,7 @@ class TestDepartmentsResource:
         )
 
         depts = mock_client.departments.list()
-        
+
         assert len(depts) == 2
         assert isinstance(depts[0], Department)
         assert depts[0].name == "Engineering"
@@ -172,7 +210,7 @@ class TestDepartmentsResource:
         )
 
         dept = mock_client.departments.get("dept_1")
-        
+
         assert isinstance(dept, Department)
         assert dept.id == "dept_1"
         assert dept.name == "Engineering"
@@ -197,7 +235,7 @@ class TestLocationsResource:
         )
 
         locations = mock_client.locations.list()
-        
+
         assert len(locations) == 2
         assert locations[0].is_remote is False
         assert locations[1].is_remote is True
@@ -228,7 +266,7 @@ class TestUsersResource:
         )
 
         users = mock_client.users.list()
-        
+
         assert len(users) == 1
         assert isinstance(users[0], User)
         assert users[0].full_name == "John Doe"
@@ -253,7 +291,7 @@ class TestProjectsResource:
         )
 
         projects = mock_client.projects.list()
-        
+
         assert len(projects) == 1
         assert isinstance(projects[0], Project)
         assert projects[0].name == "ML Engineers Pool"
@@ -282,79 +320,97 @@ class TestOffersResource:
         )
 
         offers = mock_client.offers.list()
-        
+
         assert len(offers) == 1
         assert isinstance(offers[0], Offer)
         assert offers[0].status == "Sent"
 
 
-# ---------------------------------------------------------------------------
-# Candidate Search and Add Tag Tests
-# ---------------------------------------------------------------------------
-
-
-class TestCandidateSearch:
-    """Tests for candidate search functionality."""
+class TestInterviewSchedulesResource:
+    """Tests for the interview_schedules resource."""
 
     @responses.activate
-    def test_search_by_email(self, mock_client):
-        """Test searching candidates by email."""
+    def test_list_interview_schedules(self, mock_client):
+        """Schedules should decode into their own model."""
         responses.post(
-            "https://api.ashbyhq.com/candidate.search",
+            "https://api.ashbyhq.com/interviewSchedule.list",
             json={
                 "success": True,
                 "results": [
-                    {"id": "cand_1", "name": "John Doe"},
+                    {"id": "sched_1", "applicationId": "app_1", "status": "Scheduled"}
                 ],
+                "moreDataAvailable": False,
             },
         )
 
-        candidates = mock_client.candidates.search(email="john@example.com")
-        
-        assert len(candidates) == 1
-        assert isinstance(candidates[0], Candidate)
-        assert candidates[0].name == "John Doe"
+        schedules = mock_client.interview_schedules.list()
 
-    @responses.activate
-    def test_search_by_name(self, mock_client):
-        """Test searching candidates by name."""
-        responses.post(
-            "https://api.ashbyhq.com/candidate.search",
-            json={
-                "success": True,
-                "results": [
-                    {"id": "cand_1", "name": "John Doe"},
-                    {"id": "cand_2", "name": "John Smith"},
-                ],
-            },
-        )
+        assert type(schedules[0]) is InterviewSchedule
+        assert schedules[0].application_id == "app_1"
+        assert schedules[0].status == "Scheduled"
+
+    def test_interview_schedule_positional_fields(self):
+        """InterviewSchedule keeps its own positional field order."""
+        schedule = InterviewSchedule("sched_1", "app_1", "Scheduled", "2024-01-01T10:00:00Z")
+        assert schedule.scheduled_start_time == "2024-01-01T10:00:00Z"
 
-        candidates = mock_client.candidates.search(name="John")
-        
-        assert len(candidates) == 2
+
+# ---------------------------------------------------------------------------
+# Candidate Search and Add Tag Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCandidateSearch:
+    """Tests for candidate search functionality."""
 
     @responses.activate
-    def test_search_by_email_and_name(self, mock_client):
-        """Test searching candidates by both email and name."""
+    @pytest.mark.parametrize(
+        "kwargs,results",
+        [
+            ({"email": "john@example.com"}, [{"id": "cand_1", "name": "John Doe"}]),
+            (
+                {"name": "John"},
+                [{"id": "cand_1", "name": "John Doe"}, {"id": "cand_2", "name": "John Smith"}],
+            ),
+            ({"email": "john@example.com", "name": "John"}, [{"id": "cand_1", "name": "John Doe"}]),
+        ],
+        ids=["email", "name", "email_and_name"],
+    )
+    def test_search(self, mock_client, kwargs, results):
+        """Test searching candidates by email, name, or both."""
         responses.post(
             "https://api.ashbyhq.com/candidate.search",
-            json={
-                "success": True,
-                "results": [{"id": "cand_1", "name": "John Doe"}],
-            },
+            json={"success": True, "results": results},
         )
 
-        candidates = mock_client.candidates.search(
-            email="john@example.com", name="John"
-        )
-        
-        assert len(candidates) == 1
+        candidates = mock_client.candidates.search(**kwargs)
+
+        assert json.loads(responses.calls[0].request.body) == kwargs
+        assert [c.id for c in candidates] == [r["id"] for r in results]
+        assert all(isinstance(c, Candidate) for c in candidates)
+        assert candidates[0].name == "John Doe"
 
     def test_search_requires_parameter(self, mock_client):
         """Test that search requires at least one parameter."""
         with pytest.raises(ValueError, match="At least one of email or name"):
             mock_client.candidates.search()
 
+    @responses.activate
+    def test_search_cached_only_when_requested(self, mock_client):
+        """cached=True should reuse an identical search; the default should not."""
+        responses.post(
+            "https://api.ashbyhq.com/candidate.search",
+            json={"success": True, "results": [{"id": "cand_1", "name": "John Doe"}]},
+        )
+
+        first = mock_client.candidates.search(email="john@example.com", cached=True)
+        second = mock_client.candidates.search(email="john@example.com", cached=True)
+        assert len(responses.calls) == 1
+        assert first == second and first is not second
+
+        mock_client.candidates.search(email="john@example.com")
+        assert len(responses.calls) == 2
+
 
 class TestCandidateAddTag:
     """Tests for adding tags to candidates."""
@@ -375,7 +431,7 @@ class TestCandidateAddTag:
         )
 
         candidate = mock_client.candidates.add_tag("cand_1", "tag_1")
-        
+
         assert isinstance(candidate, Candidate)
         assert len(candidate.tags) == 1
         assert candidate.tags[0].title == "VIP"
@@ -424,13 +480,15 @@ class TestFeedbackResource:
         )
 
         feedback_list = mock_client.feedback.list_for_application("app_1")
-        
+
         assert len(feedback_list) == 1
         fb = feedback_list[0]
         assert isinstance(fb, Feedback)
         assert fb.application_id == "app_1"
         assert fb.overall_recommendation == "Strong Hire"
         assert fb.get_score("Technical Skills") == 4
+        assert fb.get_score("technical skills") == 4
+        assert fb.get_score("Culture Fit") is None
         assert fb.submitter.full_name == "Jane Recruiter"
 
 
@@ -444,33 +502,194 @@ class TestPagination:
 
     @responses.activate
     def test_pagination_fetches_all_pages(self, mock_client):
-        """Test that list() fetches all pages."""
-        # First page
-        responses.post(
-            "https://api.ashbyhq.com/source.list",
-            json={
+        """Test that list() fetches all pages, following nextCursor."""
+        pages = {
+            None: {
                 "success": True,
                 "results": [{"id": "src_1", "name": "LinkedIn"}],
                 "moreDataAvailable": True,
                 "nextCursor": "cursor_1",
             },
+            "cursor_1": {
+                "success": True,
+                "results": [{"id": "src_2", "name": "Referral"}],
+                "moreDataAvailable": False,
+            },
+        }
+        cursors = []
+
+        def callback(request):
+            cursor = json.loads(request.body).get("cursor")
+            cursors.append(cursor)
+            return 200, {}, json.dumps(pages[cursor])
+
+        responses.add_callback(
+            responses.POST,
+            "https://api.ashbyhq.com/source.list",
+            callback=callback,
+            content_type="application/json",
         )
-        # Second page
+
+        sources = mock_client.sources.list()
+
+        assert [s.name for s in sources] == ["LinkedIn", "Referral"]
+        # The second request must carry the first page's cursor
+        assert cursors == [None, "cursor_1"]
+
+    @responses.activate
+    def test_iter_yields_models_lazily(self, mock_client):
+        """iter() should send nothing until consumed, then yield models."""
         responses.post(
-            "https://api.ashbyhq.com/source.list",
+            "https://api.ashbyhq.com/project.list",
             json={
                 "success": True,
-                "results": [{"id": "src_2", "name": "Referral"}],
+                "results": [{"id": "proj_1", "title": "Q3 Hiring"}],
                 "moreDataAvailable": False,
             },
         )
 
-        sources = mock_client.sources.list()
-        
-        assert len(sources) == 2
-        assert sources[0].name == "LinkedIn"
-        assert sources[1].name == "Referral"
-        # Verify two requests were made
+        projects = mock_client.projects.iter(limit=1)
+        assert len(responses.calls) == 0
+
+        assert [p.id for p in projects] == ["proj_1"]
+        assert json.loads(responses.calls[0].request.body) == {"limit": 1}
+
+
+# ---------------------------------------------------------------------------
+# Response Cache Tests
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    """Tests for caching of metadata resources."""
+
+    @responses.activate
+    def test_metadata_list_is_cached(self, mock_client):
+        """A second list() of a metadata resource should not hit the API."""
+        responses.post(
+            "https://api.ashbyhq.com/department.list",
+            json={
+                "success": True,
+                "results": [{"id": "dept_1", "name": "Engineering"}],
+                "moreDataAvailable": False,
+            },
+        )
+
+        first = mock_client.departments.list()
+        second = mock_client.departments.list()
+
+        assert first == second
+        assert first is not second
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_cached_list_follows_keep_raw(self, mock_client):
+        """A list cached with raw data should not be served to keep_raw(False) callers."""
+        from ashby_sdk.models import keep_raw
+
+        responses.post(
+            "https://api.ashbyhq.com/archiveReason.list",
+            json={
+                "success": True,
+                "results": [{"id": "ar_1", "text": "Not a fit"}],
+                "moreDataAvailable": False,
+            },
+        )
+
+        with keep_raw(True):
+            kept = mock_client.archive_reasons.list()
+        with keep_raw(False):
+            dropped = mock_client.archive_reasons.list()
+            dropped_again = mock_client.archive_reasons.list()
+
+        assert kept[0].raw_data == {"id": "ar_1", "text": "Not a fit"}
+        assert dropped[0].raw_data == {}
+        assert dropped_again == dropped
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_clear_cache_refetches(self, mock_client):
+        """clear_cache() should force the next call to hit the API."""
+        responses.post(
+            "https://api.ashbyhq.com/user.info",
+            json={
+                "success": True,
+                "results": {"id": "user_1", "firstName": "John", "lastName": "Doe"},
+            },
+        )
+
+        mock_client.users.get("user_1")
+        mock_client.users.get("user_1")
+        assert len(responses.calls) == 1
+
+        mock_client.clear_cache()
+        mock_client.users.get("user_1")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_mutable_resources_are_not_cached(self, mock_client):
+        """Offers change frequently and should always be fetched."""
+        responses.post(
+            "https://api.ashbyhq.com/offer.list",
+            json={"success": True, "results": [], "moreDataAvailable": False},
+        )
+
+        mock_client.offers.list()
+        mock_client.offers.list()
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cached_get_description_reuses_lookups(self, mock_client):
+        """cached=True should fetch a job's title, postings and posting once."""
+        responses.post(
+            "https://api.ashbyhq.com/job.info",
+            json={"success": True, "results": {"id": "job_1", "title": "Engineer"}},
+        )
+        responses.post(
+            "https://api.ashbyhq.com/jobPosting.list",
+            json={
+                "success": True,
+                "results": [
+                    {"id": "post_1", "title": "Engineer", "jobId": "job_1"},
+                    {"id": "post_2", "title": "Engineer (Internal)", "jobId": "job_1"},
+                ],
+                "moreDataAvailable": False,
+            },
+        )
+        responses.post(
+            "https://api.ashbyhq.com/jobPosting.info",
+            json={
+                "success": True,
+                "results": {"id": "post_1", "jobId": "job_1", "descriptionPlain": "Build"},
+            },
+        )
+
+        for _ in range(3):
+            assert mock_client.job_postings.get_description("job_1", cached=True) == "Build"
+
+        assert len(responses.calls) == 3
+
+    def test_cache_is_bounded(self, mock_client, monkeypatch):
+        """The oldest entry should be evicted once the cache is full."""
+        monkeypatch.setattr("ashby_sdk.client._CACHE_MAXSIZE", 2)
+        for key in ("a", "b", "c"):
+            mock_client._cached_request((key,), lambda key=key: key)
+
+        assert [key[0] for key in mock_client._cache] == ["b", "c"]
+
+    @responses.activate
+    def test_cache_disabled_with_zero_ttl(self):
+        """cache_ttl=0 should disable caching entirely."""
+        client = AshbyClient(api_key="test_api_key_12345", cache_ttl=0)
+        responses.post(
+            "https://api.ashbyhq.com/source.list",
+            json={"success": True, "results": [], "moreDataAvailable": False},
+        )
+
+        client.sources.list()
+        client.sources.list()
+
         assert len(responses.calls) == 2
 
 
@@ -486,7 +705,7 @@ class TestErrorHandling:
     def test_api_error(self, mock_client):
         """Test handling of API errors."""
         from ashby_sdk.exceptions import AshbyAPIError
-        
+
         responses.post(
             "https://api.ashbyhq.com/source.list",
             json={
@@ -503,7 +722,7 @@ class TestErrorHandling:
     def test_auth_error_401(self, mock_client):
         """Test handling of 401 authentication error."""
         from ashby_sdk.exceptions import AshbyAuthError
-        
+
         responses.post(
             "https://api.ashbyhq.com/source.list",
             status=401,
@@ -516,7 +735,7 @@ class TestErrorHandling:
     def test_auth_error_403(self, mock_client):
         """Test handling of 403 permission error."""
         from ashby_sdk.exceptions import AshbyAuthError
-        
+
         responses.post(
             "https://api.ashbyhq.com/source.list",
             status=403,
@@ -524,3 +743,37 @@ class TestErrorHandling:
 
         with pytest.raises(AshbyAuthError, match="does not have permission"):
             mock_client.sources.list()
+
+    @responses.activate
+    def test_rate_limit_is_retried(self, mock_client):
+        """A 429 followed by success should transparently succeed."""
+        responses.post("https://api.ashbyhq.com/source.list", status=429)
+        responses.post(
+            "https://api.ashbyhq.com/source.list",
+            json={
+                "success": True,
+                "results": [{"id": "src_1", "name": "LinkedIn"}],
+                "moreDataAvailable": False,
+            },
+        )
+
+        sources = mock_client.sources.list()
+
+        assert len(sources) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_rate_limit_error_after_retries(self, mock_client):
+        """Persistent 429s should raise AshbyRateLimitError once retries run out."""
+        from ashby_sdk.exceptions import AshbyRateLimitError
+
+        responses.post(
+            "https://api.ashbyhq.com/source.list",
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+
+        with pytest.raises(AshbyRateLimitError) as exc_info:
+            mock_client.sources.list()
+        assert exc_info.value.retry_after == "0"
+        assert len(responses.calls) > 1